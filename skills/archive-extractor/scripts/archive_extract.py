@@ -1,47 +1,252 @@
 #!/usr/bin/env python3
 """
-Archive Extractor - Extract archives using 7z CLI.
+Archive Extractor - Extract archives using Python's zipfile/tarfile, or the
+7z CLI for formats the standard library can't read (7z, RAR, encrypted).
 
 Usage:
     python archive_extract.py ARCHIVE [OPTIONS]
 """
 
 import argparse
+import bz2
+import functools
+import gzip
 import json
+import lzma
+import os
+import queue
+import shutil
+import stat
 import subprocess
 import sys
+import tarfile
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-SUPPORTED_EXTENSIONS = {".zip", ".rar", ".7z", ".tar", ".gz", ".tgz", ".bz2", ".xz"}
+SUPPORTED_EXTENSIONS = frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".tgz", ".bz2", ".xz"})
 
+# Compressed tarballs: 7z only unwraps the outer layer, so these are piped
+# through a second 7z that unpacks the tar stream without a temp .tar on disk
+COMPRESSED_TAR_SUFFIXES = (".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
 
+# Worker threads for extracting ZIP members in parallel
+EXTRACT_WORKERS = os.cpu_count() or 4
+
+# Copy buffer size for member extraction (stdlib default is 64 KiB);
+# buffers are pooled and reused across members and worker threads
+COPY_BUFSIZE = 1 << 20
+_copy_buffers = queue.SimpleQueue()
+
+
+@functools.lru_cache(maxsize=None)
 def find_7z() -> str:
-    """Find 7z executable."""
-    # Try common Windows locations
+    """Find 7z executable (cached for the life of the process)."""
+    on_path = shutil.which("7z")
+    if on_path:
+        return on_path
+
+    # Try common Windows locations (stat only, no --help probe)
     common_paths = [
-        "7z",
         r"C:\Program Files\7-Zip\7z.exe",
         r"C:\Program Files (x86)\7-Zip\7z.exe",
     ]
 
     for path in common_paths:
-        try:
-            result = subprocess.run(
-                [path, "--help"],
-                capture_output=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-            )
-            if result.returncode == 0:
-                return path
-        except FileNotFoundError:
-            continue
+        if Path(path).is_file():
+            return path
 
     raise FileNotFoundError(
         "7z not found. Install 7-Zip and ensure it's in PATH or at default location."
     )
 
 
+def walk_files(root: Path):
+    """Yield (path, relative_path, size) for every file under root.
+
+    Uses an explicit os.scandir stack so each entry costs at most one stat
+    (cached by DirEntry on Windows) instead of rglob + is_file + stat.
+    """
+    root_str = str(root)
+    prefix_len = len(root_str) + 1
+    stack = [root_str]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path, entry.path[prefix_len:], entry.stat().st_size
+        except OSError:
+            continue
+
+
+def _safe_target(dest: Path, name: str) -> Optional[str]:
+    """Map an archive member name to a path under dest, or None if unsafe."""
+    parts = [p for p in name.replace("\\", "/").split("/") if p not in ("", ".")]
+    if not parts or ".." in parts or ":" in parts[0]:
+        return None
+    return os.path.join(dest, *parts)
+
+
+def _copy(src, dst) -> None:
+    """Copy src to dst through a pooled COPY_BUFSIZE buffer."""
+    try:
+        buf = _copy_buffers.get_nowait()
+    except queue.Empty:
+        buf = bytearray(COPY_BUFSIZE)
+    view = memoryview(buf)
+    try:
+        while True:
+            n = src.readinto(buf)
+            if not n:
+                break
+            dst.write(view[:n])
+    finally:
+        view.release()
+        _copy_buffers.put(buf)
+
+
+def _write_member(src, target: str, overwrite: bool) -> bool:
+    """Copy an open member stream to target; False if skipped as existing.
+
+    The member is written under a temporary name and renamed into place, so
+    a failure midway (which hands the archive to 7z, and 7z skips existing
+    files) never leaves a truncated file at target.
+    """
+    if not overwrite and os.path.exists(target):
+        return False
+    directory, name = os.path.split(target)
+    os.makedirs(directory, exist_ok=True)
+    partial = os.path.join(directory, f".{name}.{os.getpid()}-{threading.get_ident()}.part")
+    try:
+        with open(partial, "wb") as out:
+            _copy(src, out)
+        os.replace(partial, target)
+    except BaseException:
+        try:
+            os.unlink(partial)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def _extract_zip(path: Path, dest: Path, overwrite: bool) -> list:
+    """Extract a ZIP with zipfile; returns [(path, relative_path, size)].
+
+    Members are fanned out over a thread pool (zlib/bz2/lzma release the
+    GIL). A ZipFile handle isn't safe for concurrent reads, so each worker
+    opens its own.
+    """
+    prefix_len = len(str(dest)) + 1
+    with zipfile.ZipFile(path) as zf:
+        members = []
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            target = _safe_target(dest, info.filename)
+            if target is not None:
+                members.append((info, target))
+
+    local = threading.local()
+    handles = []
+
+    def extract_one(member):
+        info, target = member
+        handle = getattr(local, "zf", None)
+        if handle is None:
+            handle = local.zf = zipfile.ZipFile(path)
+            handles.append(handle)
+        with handle.open(info) as src:
+            if _write_member(src, target, overwrite):
+                return target, target[prefix_len:], info.file_size
+        # Skipped as already extracted: still part of the archive's listing
+        return target, target[prefix_len:], os.path.getsize(target)
+
+    try:
+        workers = max(1, min(EXTRACT_WORKERS, len(members)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(extract_one, members))
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _extract_tar(path: Path, dest: Path, overwrite: bool) -> list:
+    """Stream a (compressed) tarball with tarfile; regular files only."""
+    extracted = []
+    prefix_len = len(str(dest)) + 1
+    with tarfile.open(path, "r|*") as tf:
+        for member in tf:
+            if not member.isfile():
+                continue
+            target = _safe_target(dest, member.name)
+            if target is None:
+                continue
+            src = tf.extractfile(member)
+            if _write_member(src, target, overwrite):
+                extracted.append((target, target[prefix_len:], member.size))
+            else:
+                # Skipped as already extracted: still part of the listing
+                extracted.append((target, target[prefix_len:], os.path.getsize(target)))
+    return extracted
+
+
+_SINGLE_FILE_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+def _extract_single(path: Path, dest: Path, overwrite: bool) -> list:
+    """Decompress a bare .gz/.bz2/.xz file into dest/<stem>."""
+    name = path.stem
+    target = os.path.join(dest, name)
+    with _SINGLE_FILE_OPENERS[path.suffix.lower()](path, "rb") as src:
+        _write_member(src, target, overwrite)
+    return [(target, name, os.path.getsize(target))]
+
+
+# Formats the standard library extracts without spawning 7z
+_STDLIB_EXTRACTORS = {
+    ".zip": _extract_zip,
+    ".tar": _extract_tar,
+    ".tgz": _extract_tar,
+    ".tbz2": _extract_tar,
+    ".txz": _extract_tar,
+    ".gz": _extract_single,
+    ".bz2": _extract_single,
+    ".xz": _extract_single,
+}
+
+
+def _stdlib_extractor(path: Path):
+    """Pick a stdlib extractor for path, or None to use 7z."""
+    name = path.name.lower()
+    if name.endswith(COMPRESSED_TAR_SUFFIXES):
+        return _extract_tar
+    return _STDLIB_EXTRACTORS.get(path.suffix.lower())
+
+
+def _success(path: Path, dest: Path, files: list, list_files: bool) -> dict:
+    """Build the success result from (path, relative_path, size) tuples."""
+    result = {
+        "source": str(path.absolute()),
+        "destination": str(dest.absolute()),
+        "file_count": len(files),
+    }
+    if list_files:
+        result["files"] = [
+            {"path": full, "relative_path": rel, "size": size}
+            for full, rel, size in files
+        ]
+    result["status"] = "success"
+    return result
+
+
 def extract_archive(
     archive_path: str,
     output_dir: Optional[str] = None,
@@ -49,8 +254,13 @@ def extract_archive(
     flat: bool = False,
     overwrite: bool = False,
     quiet: bool = False,
+    list_files: bool = True,
 ) -> dict:
-    """Extract archive using 7z."""
+    """Extract archive with the standard library, falling back to 7z.
+
+    With list_files=False the per-file listing (and its stat calls) is
+    skipped; only file_count is reported.
+    """
     path = Path(archive_path)
 
     if not path.exists():
@@ -68,101 +278,172 @@ def extract_archive(
             stem = stem[:-4]
         dest = path.parent / stem
 
-    dest.mkdir(parents=True, exist_ok=True)
+    if not quiet:
+        print(f"Extracting: {path.name} -> {dest}", file=sys.stderr)
 
+    extractor = None if password else _stdlib_extractor(path)
+    if extractor is not None:
+        try:
+            files = extractor(path, dest, overwrite)
+            return _success(path, dest, files, list_files)
+        except (zipfile.BadZipFile, tarfile.TarError, EOFError, lzma.LZMAError,
+                NotImplementedError, RuntimeError, OSError) as e:
+            # Encrypted or unsupported method (e.g. Deflate64): hand to 7z
+            stdlib_error = e
+    else:
+        stdlib_error = None
+
+    return _extract_with_7z(path, dest, password, overwrite, list_files, stdlib_error)
+
+
+def _extract_with_7z(
+    path: Path,
+    dest: Path,
+    password: Optional[str],
+    overwrite: bool,
+    list_files: bool,
+    stdlib_error: Optional[Exception] = None,
+) -> dict:
+    """Extract archive using the 7z CLI."""
     # Find 7z
     try:
         sevenzip = find_7z()
     except FileNotFoundError as e:
+        if stdlib_error is not None:
+            return {"error": str(stdlib_error), "source": str(path.absolute())}
         return {"error": str(e)}
 
-    # Build 7z command
-    cmd = [sevenzip, "x", str(path), f"-o{dest}"]
-
-    if password:
-        cmd.append(f"-p{password}")
+    # Build 7z command (7z creates the -o directory itself)
+    creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+    piped_tar = path.name.lower().endswith(COMPRESSED_TAR_SUFFIXES)
+    if piped_tar:
+        unwrap_cmd = [sevenzip, "x", str(path), "-so", "-mmt=on"]
+        if password:
+            unwrap_cmd.append(f"-p{password}")
+        cmd = [sevenzip, "x", "-si", "-ttar", f"-o{dest}"]
+    else:
+        cmd = [sevenzip, "x", str(path), f"-o{dest}"]
+        if password:
+            cmd.append(f"-p{password}")
 
     if overwrite:
         cmd.append("-aoa")  # Overwrite all
     else:
         cmd.append("-aos")  # Skip existing
 
+    cmd.append("-mmt=on")  # Multithreaded decode (LZMA2, bzip2)
     cmd.append("-y")  # Assume yes
-
-    if not quiet:
-        print(f"Extracting: {path.name} -> {dest}", file=sys.stderr)
+    cmd.append("-bb1")  # Log each extracted file as "- <path>"
+    cmd.append("-sccUTF-8")  # Console charset for the file log
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-        )
-
-        if result.returncode != 0:
+        # Stream the file log instead of buffering it and re-walking dest.
+        # stderr goes to a temp file so a chatty failure can't fill the pipe.
+        extracted_files = []
+        with tempfile.TemporaryFile() as err_file:
+            unwrap = None
+            if piped_tar:
+                unwrap = subprocess.Popen(
+                    unwrap_cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=err_file,
+                    creationflags=creationflags,
+                )
+            proc = subprocess.Popen(
+                cmd,
+                stdin=unwrap.stdout if unwrap else None,
+                stdout=subprocess.PIPE,
+                stderr=err_file,
+                encoding="utf-8",
+                errors="replace",
+                creationflags=creationflags,
+            )
+            if unwrap:
+                unwrap.stdout.close()  # Let unwrap see SIGPIPE if proc exits
+            logged = 0
+            summary_count = None
+            for line in proc.stdout:
+                if not line.startswith("- "):
+                    if line.startswith("Files: "):
+                        summary_count = int(line[7:].strip() or 0)
+                    continue
+                if not list_files:
+                    logged += 1
+                    continue
+                rel = line[2:].rstrip("\r\n")
+                full = os.path.join(dest, rel)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    extracted_files.append((full, rel, st.st_size))
+            returncode = proc.wait()
+            if unwrap and unwrap.wait() != 0:
+                returncode = unwrap.returncode
+            err_file.seek(0)
+            stderr_text = err_file.read().decode("utf-8", "replace")
+
+        if returncode != 0:
             # Check for common errors
-            stderr = result.stderr.lower()
+            stderr = stderr_text.lower()
             if "wrong password" in stderr or "encrypted" in stderr:
                 return {
                     "error": "Archive is password protected. Use --password flag.",
                     "source": str(path.absolute()),
                 }
             return {
-                "error": f"Extraction failed: {result.stderr.strip()}",
+                "error": f"Extraction failed: {stderr_text.strip()}",
                 "source": str(path.absolute()),
             }
 
-        # List extracted files
-        extracted_files = []
-        for file_path in dest.rglob("*"):
-            if file_path.is_file():
-                extracted_files.append(
-                    {
-                        "path": str(file_path),
-                        "relative_path": str(file_path.relative_to(dest)),
-                        "size": file_path.stat().st_size,
-                    }
-                )
+        if not list_files:
+            # 7z prints "Files: N" for multi-file archives; a single-file
+            # archive logs exactly one entry and no summary line
+            return {
+                "source": str(path.absolute()),
+                "destination": str(dest.absolute()),
+                "file_count": summary_count if summary_count is not None else logged,
+                "status": "success",
+            }
+
+        # Older 7z builds without -bb support log nothing; fall back to a walk
+        if not extracted_files:
+            extracted_files = list(walk_files(dest))
 
-        return {
-            "source": str(path.absolute()),
-            "destination": str(dest.absolute()),
-            "file_count": len(extracted_files),
-            "files": extracted_files,
-            "status": "success",
-        }
+        return _success(path, dest, extracted_files, list_files)
 
     except Exception as e:
         return {"error": str(e), "source": str(path.absolute())}
 
 
+def _format_file_line(f: dict) -> str:
+    """Format one extracted-file entry (dicts come from _success)."""
+    size = f["size"]
+    size_str = f"{size / 1024:.1f} KB" if size >= 1024 else f"{size} B"
+    return f"  {f['relative_path']} ({size_str})"
+
+
 def format_human_readable(result: dict) -> str:
     """Format result for human consumption."""
     if "error" in result:
         return f"Error: {result['error']}"
 
-    lines = [
+    files = result.get("files", [])
+    header = "\n".join([
         f"Archive: {Path(result.get('source', 'unknown')).name}",
         f"Extracting to: {result.get('destination', 'unknown')}",
         "",
-        f"Extracted {result.get('file_count', 0)} files:",
-    ]
-
-    files = result.get("files", [])
-    for f in files[:20]:  # Show first 20 files
-        size = f.get("size", 0)
-        size_str = (
-            f"{size / 1024:.1f} KB"
-            if size > 1024
-            else f"{size} B"
-        )
-        lines.append(f"  {f.get('relative_path', 'unknown')} ({size_str})")
+        f"Extracted {result.get('file_count', 0)} files" + (":" if "files" in result else ""),
+    ])
+    if not files:
+        return header
 
+    body = "\n".join([_format_file_line(f) for f in files[:20]])  # Show first 20 files
     if len(files) > 20:
-        lines.append(f"  ... and {len(files) - 20} more files")
+        body += f"\n  ... and {len(files) - 20} more files"
 
-    return "\n".join(lines)
+    return f"{header}\n{body}"
 
 
 def main():
@@ -198,6 +479,7 @@ def main():
         flat=args.flat,
         overwrite=args.overwrite,
         quiet=args.quiet,
+        list_files=args.json or not args.quiet,
     )
 
     if args.json:
@@ -7,18 +7,27 @@ Each asset gets its own public repo with standardized naming: ccg_{Type}_{Name}
 """
 
 import argparse
+import functools
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
+try:
+    import pygit2  # Optional: in-process init/add/commit without spawning git
+except ImportError:
+    pygit2 = None
+
 
 # .gitignore templates by tech stack
-GITIGNORE_TEMPLATES = {
+GITIGNORE_TEMPLATES = MappingProxyType({
     "rust": """# Rust
 /target/
 **/*.rs.bk
@@ -245,10 +254,10 @@ temp/
 *.bak
 *.backup
 """
-}
+})
 
 # Tech name normalization
-TECH_ALIASES = {
+TECH_ALIASES = MappingProxyType({
     "node": "javascript",
     "nodejs": "javascript",
     "js": "javascript",
@@ -262,7 +271,74 @@ TECH_ALIASES = {
     ".net": "csharp",
     "dotnet": "csharp",
     "golang": "go",
-}
+})
+
+# Templates pre-encoded once so .gitignore writes skip text-mode encoding
+GITIGNORE_BYTES = MappingProxyType({
+    name: template.encode('utf-8') for name, template in GITIGNORE_TEMPLATES.items()
+})
+
+# Every alias and canonical tech name mapped straight to its template bytes
+_GITIGNORE_RESOLVED = MappingProxyType({
+    **{alias: GITIGNORE_BYTES[name] for alias, name in TECH_ALIASES.items()},
+    **GITIGNORE_BYTES,
+})
+
+# Pipeline folders that are never the course name
+_SKIP_COURSE_DIRS = frozenset({
+    '__cc_validated_files', 'CODE', '__ccg_Project', '__ccg_Exam', '__ccg_SOP', '__ccg_Summary',
+})
+
+_COURSE_CLEAN_RE = re.compile(r'[^\w\s-]')
+_SYNTH_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_PROJECT_PREFIX_RE = re.compile(r'^Project_')
+_GH_URL_RE = re.compile(r'https://github\.com/\S+')
+_REPO_EXISTS_RE = re.compile(r'already exists', re.IGNORECASE)
+
+
+_POSIX = os.name == 'posix'
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str:
+    """Resolve an executable to an absolute path (cached)."""
+    return shutil.which(name) or name
+
+
+def _run(cmd: list, cwd: Optional[Path] = None) -> tuple[bool, str]:
+    """Run a command and return (success, output).
+
+    On POSIX, CPython only spawns via posix_spawn (instead of fork+exec)
+    for an absolute executable with close_fds=False and no cwd, so git
+    gets its working directory through -C instead.
+    """
+    if _POSIX:
+        if cwd is not None and cmd[0] == 'git':
+            cmd = ['git', '-C', str(cwd), *cmd[1:]]
+            cwd = None
+        cmd = [_which(cmd[0]), *cmd[1:]]
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=cwd,
+            capture_output=True,
+            timeout=60,
+            close_fds=not _POSIX
+        )
+        # Raw bytes, decoded once: skips TextIOWrapper on both pipes
+        output = (result.stdout + result.stderr).strip()
+        return result.returncode == 0, output.decode('utf-8', 'replace')
+    except subprocess.TimeoutExpired:
+        return False, "Command timed out"
+    except Exception as e:
+        return False, str(e)
+
+
+@functools.lru_cache(maxsize=None)
+def _gh_username() -> Optional[str]:
+    """Authenticated GitHub login, fetched once per process."""
+    success, output = _run(['gh', 'api', 'user', '-q', '.login'])
+    return output.strip() if success else None
 
 
 class GitHubSync:
@@ -275,6 +351,7 @@ class GitHubSync:
         self.discovery_path = Path(discovery_path) if discovery_path else None
         self.verbose = verbose
         self.metadata: Dict[str, Any] = {}
+        self._gitignore = GITIGNORE_BYTES['universal']
 
     def _log(self, message: str):
         """Log message if verbose."""
@@ -283,20 +360,7 @@ class GitHubSync:
 
     def _run_command(self, cmd: list, cwd: Optional[Path] = None) -> tuple[bool, str]:
         """Run a shell command and return (success, output)."""
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd or self.asset_path,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            output = result.stdout + result.stderr
-            return result.returncode == 0, output.strip()
-        except subprocess.TimeoutExpired:
-            return False, "Command timed out"
-        except Exception as e:
-            return False, str(e)
+        return _run(cmd, cwd or self.asset_path)
 
     def _load_metadata(self) -> bool:
         """Load metadata from discovery.json."""
@@ -325,6 +389,7 @@ class GitHubSync:
                         'tech_stack': [],
                         'primary_tech': '',
                     }
+                self._gitignore = self._resolve_gitignore(self.metadata['tech_stack'])
                 return True
             except Exception as e:
                 self._log(f"Warning: Could not load discovery.json: {e}")
@@ -344,13 +409,11 @@ class GitHubSync:
         """Extract course name from path."""
         if not course_path:
             return "Course"
-        path = Path(course_path)
         # Go up to find course folder (above __cc_validated_files or CODE)
-        for parent in [path] + list(path.parents):
-            if parent.name not in ('__cc_validated_files', 'CODE', '__ccg_Project', '__ccg_Exam', '__ccg_SOP', '__ccg_Summary'):
-                name = parent.name
+        for name in reversed(Path(course_path).parts):
+            if name not in _SKIP_COURSE_DIRS:
                 # Clean up the name
-                name = re.sub(r'[^\w\s-]', ' ', name)
+                name = _COURSE_CLEAN_RE.sub(' ', name)
                 name = ' '.join(name.split())
                 if len(name) > 3:
                     return name
@@ -358,7 +421,7 @@ class GitHubSync:
 
     def _synthesize_name(self, name: str) -> str:
         """Create synthesized name from course/project name."""
-        clean = re.sub(r'[^a-zA-Z0-9\s]', '', name)
+        clean = _SYNTH_CLEAN_RE.sub('', name)
         words = clean.split()[:4]
         return ''.join(w.title() for w in words)
 
@@ -366,7 +429,7 @@ class GitHubSync:
         """Generate repository name."""
         synth_name = self.metadata.get('synthesized_name', 'Unknown')
         # Remove any existing Project_ prefix to avoid duplication
-        synth_name = re.sub(r'^Project_', '', synth_name)
+        synth_name = _PROJECT_PREFIX_RE.sub('', synth_name)
         return f"ccg_{self.asset_type}_{synth_name}"
 
     def _get_description(self) -> str:
@@ -383,21 +446,20 @@ class GitHubSync:
         else:
             return f"{self.asset_type} - {desc}"
 
-    def _get_gitignore_template(self) -> str:
-        """Get appropriate .gitignore template for tech stack."""
-        tech_stack = self.metadata.get('tech_stack', [])
-
+    @staticmethod
+    def _resolve_gitignore(tech_stack: list) -> bytes:
+        """Resolve the .gitignore template for a tech stack."""
         for tech in tech_stack:
-            tech_lower = tech.lower()
-            # Check aliases first
-            if tech_lower in TECH_ALIASES:
-                tech_lower = TECH_ALIASES[tech_lower]
-            # Check if we have a template
-            if tech_lower in GITIGNORE_TEMPLATES:
-                return GITIGNORE_TEMPLATES[tech_lower]
+            template = _GITIGNORE_RESOLVED.get(tech.lower())
+            if template is not None:
+                return template
 
         # Fallback to universal
-        return GITIGNORE_TEMPLATES['universal']
+        return GITIGNORE_BYTES['universal']
+
+    def _get_gitignore_template(self) -> bytes:
+        """Get appropriate .gitignore template for tech stack."""
+        return self._gitignore
 
     def _create_gitignore(self) -> bool:
         """Create .gitignore file."""
@@ -405,8 +467,11 @@ class GitHubSync:
         template = self._get_gitignore_template()
 
         try:
-            with open(gitignore_path, 'w', encoding='utf-8') as f:
-                f.write(template)
+            fd = os.open(gitignore_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, template)
+            finally:
+                os.close(fd)
             tech = self.metadata.get('primary_tech', 'universal')
             self._log(f"> .gitignore created ({tech})")
             return True
@@ -421,6 +486,14 @@ class GitHubSync:
             self._log("> git already initialized")
             return True
 
+        if pygit2 is not None:
+            try:
+                pygit2.init_repository(str(self.asset_path))
+                self._log("> git init (pygit2)")
+                return True
+            except pygit2.GitError as e:
+                self._log(f"pygit2 init failed, falling back to git: {e}")
+
         success, output = self._run_command(['git', 'init'])
         if success:
             self._log("> git init")
@@ -430,19 +503,20 @@ class GitHubSync:
 
     def _git_add_commit(self) -> bool:
         """Add all files and commit."""
+        if pygit2 is not None:
+            try:
+                return self._pygit2_add_commit()
+            except (pygit2.GitError, KeyError) as e:
+                # KeyError: no user.name/user.email for the default signature
+                self._log(f"pygit2 commit failed, falling back to git: {e}")
+
         # Add all files
         success, output = self._run_command(['git', 'add', '.'])
         if not success:
             self._log(f"x git add failed: {output}")
             return False
 
-        # Check if there are changes to commit
-        success, output = self._run_command(['git', 'status', '--porcelain'])
-        if not output.strip():
-            self._log("> nothing to commit")
-            return True
-
-        # Commit
+        # Commit directly; an empty index is reported as "nothing to commit"
         success, output = self._run_command(['git', 'commit', '-m', 'init commit'])
         if success:
             self._log('> git commit "init commit"')
@@ -454,10 +528,26 @@ class GitHubSync:
             self._log(f"x git commit failed: {output}")
         return success
 
-    def _check_repo_exists(self, repo_name: str) -> bool:
-        """Check if repo already exists on GitHub."""
-        success, output = self._run_command(['gh', 'repo', 'view', repo_name], cwd=Path.cwd())
-        return success
+    def _pygit2_add_commit(self) -> bool:
+        """Stage everything and commit in-process via pygit2."""
+        repo = pygit2.Repository(str(self.asset_path))
+        repo.index.add_all()
+        repo.index.write()
+        tree = repo.index.write_tree()
+
+        if repo.head_is_unborn:
+            parents = []
+        else:
+            head = repo.head.peel(pygit2.Commit)
+            if head.tree_id == tree:
+                self._log("> nothing to commit")
+                return True
+            parents = [head.id]
+
+        sig = repo.default_signature
+        repo.create_commit('HEAD', sig, sig, 'init commit', tree, parents)
+        self._log('> git commit "init commit" (pygit2)')
+        return True
 
     def _create_github_repo(self, repo_name: str, description: str) -> tuple[bool, str]:
         """Create new GitHub repo and push."""
@@ -473,7 +563,7 @@ class GitHubSync:
         if success:
             self._log("> gh repo create (new repo)")
             # Extract URL from output
-            url_match = re.search(r'https://github\.com/[^\s]+', output)
+            url_match = _GH_URL_RE.search(output)
             url = url_match.group(0) if url_match else f"https://github.com/{repo_name}"
             return True, url
         else:
@@ -483,10 +573,9 @@ class GitHubSync:
     def _push_to_existing(self, repo_name: str) -> tuple[bool, str]:
         """Push to existing GitHub repo."""
         # Get current user
-        success, username = self._run_command(['gh', 'api', 'user', '-q', '.login'], cwd=Path.cwd())
-        if not success:
+        username = _gh_username()
+        if not username:
             return False, "Could not get GitHub username"
-        username = username.strip()
 
         remote_url = f"https://github.com/{username}/{repo_name}.git"
 
@@ -545,13 +634,13 @@ class GitHubSync:
                 'repo_name': repo_name
             }
 
-        # Check if repo exists and create/push accordingly
-        if self._check_repo_exists(repo_name):
+        # Optimistically create (the common first-sync case); only fall back
+        # to pushing when GitHub reports the name is already taken
+        success, result = self._create_github_repo(repo_name, description)
+        action = 'created'
+        if not success and _REPO_EXISTS_RE.search(result):
             success, result = self._push_to_existing(repo_name)
             action = 'updated'
-        else:
-            success, result = self._create_github_repo(repo_name, description)
-            action = 'created'
 
         if success:
             print(f"       -> {result}", file=sys.stderr)
@@ -569,17 +658,42 @@ class GitHubSync:
             }
 
 
+def sync_many(jobs: list, max_workers: int = 8, verbose: bool = False) -> list:
+    """Sync several assets concurrently.
+
+    Each job is a dict of GitHubSync keyword arguments (asset_path,
+    asset_type, optional discovery_path). Syncs are network-bound, so a
+    thread pool overlaps them; the gh username is fetched once up front
+    and shared by every worker. A job that raises (e.g. a manifest entry
+    missing a key) yields an error result instead of aborting the batch.
+    """
+    _gh_username()
+
+    def run(job: dict) -> Dict[str, Any]:
+        try:
+            return GitHubSync(verbose=verbose, **job).sync()
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f"{type(e).__name__}: {e}",
+                'repo_name': Path(job.get('asset_path', '')).name or None
+            }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run, jobs))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Sync generated assets to GitHub'
     )
     parser.add_argument(
         'asset_path',
+        nargs='?',
         help='Path to the generated asset folder'
     )
     parser.add_argument(
         '--type', '-t',
-        required=True,
         choices=['Project', 'Exam', 'SOP', 'Summary'],
         help='Type of asset being synced'
     )
@@ -587,6 +701,16 @@ def main():
         '--discovery', '-d',
         help='Path to discovery.json with metadata'
     )
+    parser.add_argument(
+        '--batch', '-b',
+        help='JSON manifest: list of {asset_path, asset_type, discovery_path} jobs'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=8,
+        help='Concurrent syncs in --batch mode (default: 8)'
+    )
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
@@ -600,6 +724,26 @@ def main():
 
     args = parser.parse_args()
 
+    if args.batch:
+        with open(args.batch, 'r', encoding='utf-8') as f:
+            jobs = json.load(f)
+        results = sync_many(jobs, max_workers=args.workers,
+                            verbose=args.verbose or args.json)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            for result in results:
+                if result['success']:
+                    print(f"Synced: {result['repo_url']}")
+                else:
+                    print(f"Failed: {result['error']}", file=sys.stderr)
+        if not all(r['success'] for r in results):
+            sys.exit(1)
+        return
+
+    if not args.asset_path or not args.type:
+        parser.error('asset_path and --type are required (or use --batch)')
+
     syncer = GitHubSync(
         asset_path=args.asset_path,
         asset_type=args.type,
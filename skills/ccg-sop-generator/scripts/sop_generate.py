@@ -11,22 +11,93 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from datetime import datetime
 
+try:
+    import ahocorasick  # Optional: match all action verbs in one pass per line
+except ImportError:
+    ahocorasick = None
+
+# Precompiled patterns (compiled once at import, not looked up per call)
+_RE_HASH_PREFIX = re.compile(r"^#+\s*", re.MULTILINE)
+_RE_BULLET_PREFIX = re.compile(r"^[\-\*]\s*", re.MULTILINE)
+_RE_STAR_EMPHASIS = re.compile(r"\*+([^*]+)\*+")
+_RE_UNDERSCORE_EMPHASIS = re.compile(r"_+([^_]+)_+")
+_RE_WS = re.compile(r"\s+")
+_SENTENCE_PUNCT = frozenset(".!?")
+_RE_STEP_PREFIX = re.compile(r"^\d+[:\.\)]\s*")
+_RE_UNSAFE_FILENAME = re.compile(r"[^\w\s-]")
+
+# Pattern: "Term: definition" or "Term - definition"
+_TERM_PATTERNS = [
+    re.compile(r"^([A-Z][a-zA-Z\s]+):\s+(.+)$", re.MULTILINE),
+    re.compile(r"^([A-Z][a-zA-Z\s]+)\s+-\s+(.+)$", re.MULTILINE),
+    re.compile(r"\*\*([^*]+)\*\*:\s+(.+)", re.MULTILINE),
+    re.compile(r"\"([^\"]+)\"\s+(?:is|means|refers to)\s+(.+)", re.MULTILINE),
+]
+
+
+# Action verbs that start procedures
+ACTION_VERBS = (
+    "click", "select", "open", "close", "create", "delete", "enter", "type",
+    "navigate", "go to", "press", "run", "execute", "install", "configure",
+    "set up", "download", "upload", "save", "load", "import", "export",
+    "copy", "paste", "drag", "drop", "right-click", "double-click",
+    "check", "uncheck", "enable", "disable", "start", "stop", "restart",
+    "build", "compile", "deploy", "test", "verify", "confirm", "ensure",
+    "add", "remove", "update", "modify", "edit", "change", "define",
+    "initialize", "connect", "disconnect", "login", "logout", "authenticate"
+)
+# Space-wrapped forms for mid-line matching, built once rather than per line
+_VERB_WRAPPED = tuple(f" {verb} " for verb in ACTION_VERBS)
+
+if ahocorasick is not None:
+    _VERB_AUTOMATON = ahocorasick.Automaton()
+    for _verb in _VERB_WRAPPED:
+        _VERB_AUTOMATON.add_word(_verb, _verb)
+    _VERB_AUTOMATON.make_automaton()
+else:
+    _VERB_AUTOMATON = None
+
+
+def _mentions_action_verb(clean_line: str) -> bool:
+    """True if a lowercased line starts with or contains an action verb."""
+    if clean_line.startswith(ACTION_VERBS):
+        return True
+    if _VERB_AUTOMATON is not None:
+        return next(_VERB_AUTOMATON.iter(clean_line), None) is not None
+    return any(verb in clean_line for verb in _VERB_WRAPPED)
+
 
 def clean_text(text: str) -> str:
     """Clean up text by removing artifacts and normalizing whitespace."""
     text = text.replace("\\n", " ")
-    text = re.sub(r"^#+\s*", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^[\-\*]\s*", "", text, flags=re.MULTILINE)
-    text = re.sub(r"\*+([^*]+)\*+", r"\1", text)
-    text = re.sub(r"_+([^_]+)_+", r"\1", text)
-    text = re.sub(r"\s+", " ", text)
+    text = _RE_HASH_PREFIX.sub("", text)
+    text = _RE_BULLET_PREFIX.sub("", text)
+    text = _RE_STAR_EMPHASIS.sub(r"\1", text)
+    text = _RE_UNDERSCORE_EMPHASIS.sub(r"\1", text)
+    text = _RE_WS.sub(" ", text)
     return text.strip()
 
 
+def _is_heading(line: str) -> bool:
+    """Plain-string form of ^#{1,3}\\s+ for a stripped line."""
+    hashes = len(line) - len(line.lstrip("#"))
+    return 1 <= hashes <= 3 and hashes < len(line) and line[hashes].isspace()
+
+
+def _is_strong_statement(line: str) -> bool:
+    """Plain-string form of ^[A-Z][^.!?]*:$ for a stripped line."""
+    return (
+        line.endswith(":")
+        and "A" <= line[0] <= "Z"
+        and _SENTENCE_PUNCT.isdisjoint(line)
+    )
+
+
 def extract_procedures(content: str, filename: str) -> list[dict[str, Any]]:
     """Extract procedural content from text."""
     procedures = []
@@ -39,18 +110,6 @@ def extract_procedures(content: str, filename: str) -> list[dict[str, Any]]:
         r"(?:to\s+\w+\s*,?\s*)(.+)",
     ]
 
-    # Action verbs that start procedures
-    action_verbs = [
-        "click", "select", "open", "close", "create", "delete", "enter", "type",
-        "navigate", "go to", "press", "run", "execute", "install", "configure",
-        "set up", "download", "upload", "save", "load", "import", "export",
-        "copy", "paste", "drag", "drop", "right-click", "double-click",
-        "check", "uncheck", "enable", "disable", "start", "stop", "restart",
-        "build", "compile", "deploy", "test", "verify", "confirm", "ensure",
-        "add", "remove", "update", "modify", "edit", "change", "define",
-        "initialize", "connect", "disconnect", "login", "logout", "authenticate"
-    ]
-
     lines = content.split("\n")
     current_procedure = None
     steps = []
@@ -61,14 +120,14 @@ def extract_procedures(content: str, filename: str) -> list[dict[str, Any]]:
             continue
 
         # Check if line starts a new procedure (heading or strong statement)
-        if re.match(r"^#{1,3}\s+", line) or re.match(r"^[A-Z][^.!?]*:$", line):
+        if _is_heading(line) or _is_strong_statement(line):
             if current_procedure and len(steps) >= 3:
                 procedures.append({
                     "title": current_procedure,
                     "steps": steps,
                     "source": filename
                 })
-            current_procedure = re.sub(r"^#+\s*", "", line).strip(": ")
+            current_procedure = _RE_HASH_PREFIX.sub("", line).strip(": ")
             steps = []
             continue
 
@@ -77,15 +136,13 @@ def extract_procedures(content: str, filename: str) -> list[dict[str, Any]]:
         is_step = False
 
         # Check for numbered steps
-        if re.match(r"^\d+[:\.\)]\s*", line):
+        if line[0].isdigit() and _RE_STEP_PREFIX.match(line):
             is_step = True
-            line = re.sub(r"^\d+[:\.\)]\s*", "", line)
+            line = _RE_STEP_PREFIX.sub("", line)
 
         # Check for action verbs
-        for verb in action_verbs:
-            if clean_line.startswith(verb) or f" {verb} " in clean_line:
-                is_step = True
-                break
+        if not is_step and _mentions_action_verb(clean_line):
+            is_step = True
 
         if is_step and len(line) > 10:
             steps.append(clean_text(line))
@@ -107,10 +164,8 @@ def extract_procedures(content: str, filename: str) -> list[dict[str, Any]]:
             if not line or len(line) < 10:
                 continue
             clean_line = clean_text(line).lower()
-            for verb in action_verbs:
-                if clean_line.startswith(verb):
-                    imperative_steps.append(clean_text(line))
-                    break
+            if clean_line.startswith(ACTION_VERBS):
+                imperative_steps.append(clean_text(line))
 
         if len(imperative_steps) >= 3:
             # Create a procedure from the filename
@@ -128,16 +183,8 @@ def extract_terms(content: str) -> dict[str, str]:
     """Extract terms and definitions from content."""
     terms = {}
 
-    # Pattern: "Term: definition" or "Term - definition"
-    patterns = [
-        r"^([A-Z][a-zA-Z\s]+):\s+(.+)$",
-        r"^([A-Z][a-zA-Z\s]+)\s+-\s+(.+)$",
-        r"\*\*([^*]+)\*\*:\s+(.+)",
-        r"\"([^\"]+)\"\s+(?:is|means|refers to)\s+(.+)",
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, content, re.MULTILINE)
+    for pattern in _TERM_PATTERNS:
+        matches = pattern.findall(content)
         for term, definition in matches:
             term = term.strip()
             definition = clean_text(definition)
@@ -147,27 +194,53 @@ def extract_terms(content: str) -> dict[str, str]:
     return terms
 
 
-def generate_sop_file(procedure: dict[str, Any], index: int) -> str:
-    """Generate a single SOP markdown file."""
-    title = procedure["title"]
-    steps = procedure["steps"]
-    source = procedure["source"]
+def _walk_files(root: str, extensions: set[str]):
+    """Yield paths of files under root whose extension is in extensions.
+
+    Walks with os.scandir so DirEntry's cached type bits replace the per-entry
+    stat and Path objects of rglob; visits directories in the same pre-order.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _process_file(file_path: str) -> tuple[list[dict[str, Any]], dict[str, str]]:
+    """Read one file and run both extractors on it (ProcessPoolExecutor worker)."""
+    try:
+        file_path = Path(file_path)
+        content = file_path.read_text(encoding="utf-8", errors="ignore")
+        return extract_procedures(content, file_path.name), extract_terms(content)
+    except Exception:
+        return [], {}
+
 
-    content = f"""# SOP: {title}
+# Fixed SOP scaffold; generate_sop_file only formats the variable slots
+_SOP_HEAD = """# SOP: {title}
 
 **Document ID:** SOP-{index:03d}
 **Source:** {source}
-**Generated:** {datetime.now().strftime("%Y-%m-%d")}
+**Generated:** {date}
 
 ---
 
 ## Purpose
 
-This procedure documents the steps required to {title.lower()}.
+This procedure documents the steps required to {lower_title}.
 
 ## Scope
 
-This SOP applies to users who need to perform {title.lower()} operations.
+This SOP applies to users who need to perform {lower_title} operations.
 
 ## Prerequisites
 
@@ -181,14 +254,7 @@ This SOP applies to users who need to perform {title.lower()} operations.
 
 """
 
-    for i, step in enumerate(steps, 1):
-        content += f"""### Step {i}
-
-{step}
-
-"""
-
-    content += """---
+_SOP_TAIL = """---
 
 ## Verification
 
@@ -214,56 +280,69 @@ Confirm that all steps have been completed successfully by:
 *This SOP was auto-generated from course content. Review and validate before use in production.*
 """
 
-    return content
+
+def generate_sop_file(procedure: dict[str, Any], index: int, today: str = "") -> str:
+    """Generate a single SOP markdown file (today: YYYY-MM-DD, default now)."""
+    title = procedure["title"]
+    head = _SOP_HEAD.format(
+        title=title,
+        index=index,
+        source=procedure["source"],
+        date=today or datetime.now().strftime("%Y-%m-%d"),
+        lower_title=title.lower(),
+    )
+    steps = "".join(f"### Step {i}\n\n{step}\n\n" for i, step in enumerate(procedure["steps"], 1))
+    return "".join((head, steps, _SOP_TAIL))
 
 
 def generate_quick_reference(procedures: list[dict[str, Any]]) -> str:
     """Generate a quick reference checklist."""
-    content = """# Quick Reference Guide
+    parts = ["""# Quick Reference Guide
 
 Condensed checklists for all procedures. Use full SOPs for detailed instructions.
 
 ---
 
-"""
+"""]
 
     for i, proc in enumerate(procedures, 1):
-        content += f"""## {proc['title']}
+        parts.append(f"""## {proc['title']}
 
-"""
+""")
         for j, step in enumerate(proc["steps"], 1):
             # Truncate long steps for quick reference
             short_step = step[:80] + "..." if len(step) > 80 else step
-            content += f"- [ ] **Step {j}:** {short_step}\n"
-        content += "\n---\n\n"
+            parts.append(f"- [ ] **Step {j}:** {short_step}\n")
+        parts.append("\n---\n\n")
 
-    return content
+    return "".join(parts)
 
 
 def generate_glossary(terms: dict[str, str]) -> str:
     """Generate a glossary file."""
-    content = """# Glossary
+    parts = ["""# Glossary
 
 Terms and definitions used throughout these procedures.
 
 ---
 
-"""
+"""]
 
     if not terms:
-        content += "*No specific terms were extracted. Add terms manually as needed.*\n"
+        parts.append("*No specific terms were extracted. Add terms manually as needed.*\n")
     else:
         for term in sorted(terms.keys()):
-            content += f"**{term}**\n: {terms[term]}\n\n"
+            parts.append(f"**{term}**\n: {terms[term]}\n\n")
 
-    return content
+    return "".join(parts)
 
 
-def generate_readme(procedures: list[dict[str, Any]], output_dir: str) -> str:
+def generate_readme(procedures: list[dict[str, Any]], output_dir: str, generated: str = "") -> str:
     """Generate the main README with navigation."""
-    content = f"""# Standard Operating Procedures
+    generated = generated or datetime.now().strftime("%Y-%m-%d %H:%M")
+    parts = [f"""# Standard Operating Procedures
 
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}
+Generated: {generated}
 
 This directory contains {len(procedures)} Standard Operating Procedures extracted from course content.
 
@@ -273,14 +352,14 @@ This directory contains {len(procedures)} Standard Operating Procedures extracte
 
 | ID | Procedure | Steps | Source |
 |----|-----------|-------|--------|
-"""
+"""]
 
     for i, proc in enumerate(procedures, 1):
         safe_title = proc["title"].replace("|", "-")
         filename = f"SOP-{i:03d}_{proc['title'][:30].replace(' ', '_')}.md"
-        content += f"| SOP-{i:03d} | [{safe_title}](procedures/{filename}) | {len(proc['steps'])} | {proc['source']} |\n"
+        parts.append(f"| SOP-{i:03d} | [{safe_title}](procedures/{filename}) | {len(proc['steps'])} | {proc['source']} |\n")
 
-    content += """
+    parts.append("""
 
 ---
 
@@ -302,9 +381,9 @@ This directory contains {len(procedures)} Standard Operating Procedures extracte
 - Review and validate procedures before production use
 - Update version numbers when making changes
 - Maintain change history for audit purposes
-"""
+""")
 
-    return content
+    return "".join(parts)
 
 
 def main():
@@ -333,22 +412,16 @@ def main():
 
     extensions = {".txt", ".md", ".srt", ".vtt", ".py", ".js", ".ts", ".cpp", ".java", ".cs"}
 
-    for file_path in input_path.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in extensions:
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
+    file_paths = list(_walk_files(str(input_path), extensions))
 
-                # Extract procedures
-                procedures = extract_procedures(content, file_path.name)
+    # Files are independent, so fan the regex work out across processes and
+    # merge in input order
+    if file_paths:
+        with ProcessPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as ex:
+            for procedures, terms in ex.map(_process_file, file_paths, chunksize=16):
                 all_procedures.extend(procedures)
-
-                # Extract terms
-                terms = extract_terms(content)
                 all_terms.update(terms)
 
-            except Exception as e:
-                continue
-
     if not all_procedures:
         result = {"success": False, "error": "No procedural content found in input files"}
         if args.json:
@@ -373,18 +446,28 @@ def main():
     procedures_dir = output_path / "procedures"
     procedures_dir.mkdir(exist_ok=True)
 
+    # Format the run's timestamp once rather than per SOP
+    now = datetime.now()
+    today_str = now.strftime("%Y-%m-%d")
+    today_full = now.strftime("%Y-%m-%d %H:%M")
+
     # Generate individual SOP files
+    # Writes are I/O-bound; overlap them with rendering the next SOP
     generated_files = []
-    for i, proc in enumerate(all_procedures, 1):
-        sop_content = generate_sop_file(proc, i)
-        safe_title = re.sub(r"[^\w\s-]", "", proc["title"])[:30].replace(" ", "_")
-        filename = f"SOP-{i:03d}_{safe_title}.md"
-        file_path = procedures_dir / filename
-        file_path.write_text(sop_content, encoding="utf-8")
-        generated_files.append(str(file_path))
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+        writes = []
+        for i, proc in enumerate(all_procedures, 1):
+            sop_content = generate_sop_file(proc, i, today_str)
+            safe_title = _RE_UNSAFE_FILENAME.sub("", proc["title"])[:30].replace(" ", "_")
+            filename = f"SOP-{i:03d}_{safe_title}.md"
+            file_path = procedures_dir / filename
+            writes.append(ex.submit(file_path.write_text, sop_content, encoding="utf-8"))
+            generated_files.append(str(file_path))
+        for write in writes:
+            write.result()
 
     # Generate README
-    readme_content = generate_readme(all_procedures, str(output_path))
+    readme_content = generate_readme(all_procedures, str(output_path), today_full)
     readme_path = output_path / "README.md"
     readme_path.write_text(readme_content, encoding="utf-8")
     generated_files.append(str(readme_path))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Regression checks for the action-verb step detection in sop_generate.
+
+Run with: python -m unittest test_sop_generate (from this directory)
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import sop_generate  # noqa: E402
+
+# Non-numbered lines only, so every step must come from the verb check
+HEADED = """## Deploying the Service
+
+Open the deployment dashboard in a browser.
+You should then run the migration script on staging.
+Verify that the health check reports green.
+Restart the worker pool once traffic settles.
+"""
+
+# No headings or strong statements, so only the imperative fallback applies
+UNHEADED = """Install the command line tools first.
+Configure the credentials file for the account.
+Download the latest release archive.
+"""
+
+
+class ActionVerbTest(unittest.TestCase):
+    def test_mentions_action_verb(self):
+        self.assertTrue(sop_generate._mentions_action_verb("open the file"))
+        self.assertTrue(sop_generate._mentions_action_verb("you should run it"))
+        self.assertFalse(sop_generate._mentions_action_verb("nothing to see"))
+
+    def test_verb_steps_under_heading(self):
+        procedures = sop_generate.extract_procedures(HEADED, "deploy.md")
+        self.assertEqual(len(procedures), 1)
+        self.assertEqual(procedures[0]["title"], "Deploying the Service")
+        self.assertEqual(len(procedures[0]["steps"]), 4)
+
+    def test_imperative_fallback(self):
+        procedures = sop_generate.extract_procedures(UNHEADED, "setup_guide.md")
+        self.assertEqual(len(procedures), 1)
+        self.assertEqual(procedures[0]["title"], "Setup Guide Procedure")
+        self.assertEqual(len(procedures[0]["steps"]), 3)
+
+    def test_substring_fallback_without_automaton(self):
+        with mock.patch.object(sop_generate, "_VERB_AUTOMATON", None):
+            self.test_mentions_action_verb()
+            self.test_verb_steps_under_heading()
+
+    @unittest.skipIf(sop_generate.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_matches_substring_fallback(self):
+        lines = [line.lower() for line in (HEADED + UNHEADED).splitlines()]
+        expected = [any(v in line for v in sop_generate._VERB_WRAPPED) for line in lines]
+        got = [next(sop_generate._VERB_AUTOMATON.iter(line), None) is not None
+               for line in lines]
+        self.assertEqual(got, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,72 +7,250 @@ Usage:
 """
 
 import argparse
+import bisect
+import heapq
 import json
+import mmap
+import os
 import re
 import sys
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
+try:
+    import hyperscan  # Optional: one-pass multi-pattern sentence prefilter
+except ImportError:
+    hyperscan = None
+
+try:
+    import pyarrow as pa  # Optional: vectorized key-point filtering
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+# Precompiled patterns (compiled once at import, not looked up per call)
+_RE_HASH_PREFIX = re.compile(r"^#+\s*", re.MULTILINE)
+_RE_BULLET_PREFIX = re.compile(r"^[\-\*]\s*", re.MULTILINE)
+_RE_STAR_EMPHASIS = re.compile(r"\*+([^*]+)\*+")
+_RE_UNDERSCORE_EMPHASIS = re.compile(r"_+([^_]+)_+")
+_RE_WS = re.compile(r"\s+")
+
+# Byte-level twins of the clean_text patterns, run directly over mmap'd
+# files. str-mode \s also matches Unicode spaces, so their UTF-8 encodings
+# are spelled out to keep the results identical.
+_WS_B = rb"(?:[\t\n\x0b\x0c\r\x1c-\x1f ]|\xc2[\x85\xa0]|\xe1\x9a\x80|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)"
+_RE_STAR_EMPHASIS_B = re.compile(rb"\*+([^*]+)\*+")
+_RE_UNDERSCORE_EMPHASIS_B = re.compile(rb"_+([^_]+)_+")
+_RE_WS_B = re.compile(_WS_B + rb"+")
+_RE_BLANK_B = re.compile(_WS_B + rb"*")
+_RE_HASH_PREFIX_B = re.compile(rb"^#+" + _WS_B + rb"*", re.MULTILINE)
+_RE_BULLET_PREFIX_B = re.compile(rb"^[\-\*]" + _WS_B + rb"*", re.MULTILINE)
+_RE_ESCAPED_NEWLINE_B = re.compile(rb"\\n")
+
+_RE_SENTENCE_SPLIT = re.compile(r"[.!?]+")
+_RE_SLUG = re.compile(r"[^a-z0-9]+")
+
+_TOPIC_INDICATORS = [
+    re.compile(r"^([A-Z][a-z]+(?:\s+[A-Z]?[a-z]+)*)\s+(?:is|are|refers to|means|defines)"),
+    re.compile(r"(?:The\s+)?([A-Z][a-z]+(?:\s+[a-z]+)*)\s+(?:is defined as|represents|provides)"),
+    re.compile(r"^([A-Z][a-z]+(?:\s+[a-z]+)*)\s*[-:]\s*"),
+]
+# Literals at least one of which every _TOPIC_INDICATORS match contains
+# (sentences are whitespace-collapsed by clean_text, so "\s+" is one space)
+_TOPIC_LITERALS = (
+    " is", " are", " refers to", " means", " defines", " represents", " provides", "-", ":"
+)
+
+_DEFINITION_PATTERNS = [
+    re.compile(r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is defined as\s+(.+)"),
+    re.compile(r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+refers to\s+(.+)"),
+    re.compile(r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+means\s+(.+)"),
+    re.compile(r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is\s+(?:a|an|the)\s+(.+)"),
+]
+# The four patterns as one alternation (in priority order), so most sentences
+# take a single search; the verb group says which pattern matched
+_RE_DEFINITION = re.compile(
+    r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+(?P<verb>is defined as|refers to|means|is\s+(?:a|an|the))\s+(.+)"
+)
+_DEFINITION_VERBS = ("is defined as", "refers to", "means")
+
+
+IMPORTANCE_KEYWORDS = (
+    "important", "key", "essential", "must", "should", "always",
+    "never", "critical", "fundamental", "primary", "main"
+)
+_KEYWORD_ALTERNATION = "|".join(map(re.escape, IMPORTANCE_KEYWORDS))
+# Whole-word, case-insensitive keyword scan (so "main" no longer hits
+# "mainstream"); the substring forms above remain valid as prefilters
+_IMPORTANCE_RE = re.compile(rf"\b(?:{_KEYWORD_ALTERNATION})\b", re.IGNORECASE)
+
+
+def _compile_prefilter(patterns: list[str], extra_flags: int = 0):
+    """Compile a Hyperscan database, or None when Hyperscan is unavailable."""
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | extra_flags
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.encode("utf-8") for p in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[flags] * len(patterns),
+    )
+    return db
+
+
+# Relaxed forms of the patterns above (no anchors, no trailing capture): any
+# sentence the real patterns match also hits one of these, so sentences with
+# no hit can skip the per-pattern re.search calls entirely
+_TOPIC_PREFILTER = _compile_prefilter([
+    r"[A-Z][a-z]+(?:\s+[A-Z]?[a-z]+)*\s+(?:is|are|refers to|means|defines)",
+    r"[A-Z][a-z]+(?:\s+[a-z]+)*\s+(?:is defined as|represents|provides)",
+    r"[A-Z][a-z]+(?:\s+[a-z]+)*\s*[-:]",
+])
+_DEFINITION_PREFILTER = _compile_prefilter([
+    r"[A-Z][a-z]+(?:\s+[a-z]+)*\s+(?:is defined as|refers to|means|is\s+(?:a|an|the))\s",
+])
+_KEYWORD_PREFILTER = _compile_prefilter(
+    list(IMPORTANCE_KEYWORDS),
+    hyperscan.HS_FLAG_CASELESS if hyperscan is not None else 0,
+)
+
+
+def _prefilter_sentences(db, sentences: list[str]) -> Optional[set]:
+    """Indices of sentences with a prefilter hit, from one Hyperscan scan.
+
+    Returns None (check every sentence) when Hyperscan is unavailable.
+    """
+    if db is None:
+        return None
+    try:
+        encoded = [sentence.encode("utf-8") for sentence in sentences]
+    except UnicodeEncodeError:
+        return None
+    # NUL can't match any prefilter pattern, so hits never span sentences
+    starts = []
+    offset = 0
+    for chunk in encoded:
+        starts.append(offset)
+        offset += len(chunk) + 1
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(bisect.bisect_right(starts, end - 1) - 1)
+
+    db.scan(b"\0".join(encoded), match_event_handler=on_match)
+    return hits
+
+
+def _iter_sentences(text: str):
+    """Lazily yield the raw pieces re.split(_RE_SENTENCE_SPLIT) would return."""
+    prev = 0
+    for match in _RE_SENTENCE_SPLIT.finditer(text):
+        yield text[prev:match.start()]
+        prev = match.end()
+    yield text[prev:]
+
+
+def split_sentences(content: list[dict]) -> list[str]:
+    """Join all content once and split it into stripped, non-empty sentences."""
+    all_text = " ".join(item["text"] for item in content)
+    stripped = (sentence.strip() for sentence in _iter_sentences(all_text))
+    return [sentence for sentence in stripped if sentence]
+
+
+def clean_file(file_path: Path) -> Optional[str]:
+    """Read and clean a file without first decoding it to a full str.
+
+    The file is memory-mapped and cleaned as bytes; only the (smaller)
+    cleaned result is decoded. Returns None for blank files.
+    """
+    with open(file_path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file can't be mapped
+            return None
+        with data:
+            if _RE_BLANK_B.fullmatch(data):
+                return None
+            text = _RE_ESCAPED_NEWLINE_B.sub(b" ", data)
+    # read_text's universal newlines: a lone \r also starts a line for the
+    # ^-anchored prefix passes
+    if b"\r" in text:
+        text = text.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    # Same passes, in the same order, as clean_text
+    text = _RE_HASH_PREFIX_B.sub(b"", text)
+    text = _RE_BULLET_PREFIX_B.sub(b"", text)
+    text = _RE_STAR_EMPHASIS_B.sub(rb"\1", text)
+    text = _RE_UNDERSCORE_EMPHASIS_B.sub(rb"\1", text)
+    text = _RE_WS_B.sub(b" ", text)
+    return text.decode("utf-8", errors="replace").strip()
+
 
 def clean_text(text: str) -> str:
     """Clean up text by removing artifacts and normalizing whitespace."""
     text = text.replace("\\n", " ")
-    text = re.sub(r"^#+\s*", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^[\-\*]\s*", "", text, flags=re.MULTILINE)
-    text = re.sub(r"\*+([^*]+)\*+", r"\1", text)
-    text = re.sub(r"_+([^_]+)_+", r"\1", text)
-    text = re.sub(r"\s+", " ", text)
+    text = _RE_HASH_PREFIX.sub("", text)
+    text = _RE_BULLET_PREFIX.sub("", text)
+    text = _RE_STAR_EMPHASIS.sub(r"\1", text)
+    text = _RE_UNDERSCORE_EMPHASIS.sub(r"\1", text)
+    text = _RE_WS.sub(" ", text)
     return text.strip()
 
 
+def _load_file(file_path: Path) -> Optional[dict]:
+    """Clean one file into a content entry (ProcessPoolExecutor worker)."""
+    try:
+        text = clean_file(file_path)
+    except Exception:
+        return None
+    if text is None:
+        return None
+    return {
+        "source": str(file_path),
+        "filename": file_path.name,
+        "text": text
+    }
+
+
 def load_content(input_dir: str) -> list[dict]:
     """Load all text content from validated files directory."""
-    content = []
     input_path = Path(input_dir)
 
     if not input_path.exists():
         raise FileNotFoundError(f"Input directory not found: {input_dir}")
 
     extensions = ["*.txt", "*.md", "*.srt", "*.csv"]
-    for ext in extensions:
-        for file_path in input_path.rglob(ext):
-            try:
-                text = file_path.read_text(encoding="utf-8", errors="replace")
-                if text.strip():
-                    content.append({
-                        "source": str(file_path),
-                        "filename": file_path.name,
-                        "text": clean_text(text)
-                    })
-            except Exception:
-                continue
+    file_paths = [file_path for ext in extensions for file_path in input_path.rglob(ext)]
+    if not file_paths:
+        return []
 
-    return content
+    # Cleaning is per-file regex work with no shared state; map preserves order
+    with ProcessPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 1)) as ex:
+        return [entry for entry in ex.map(_load_file, file_paths, chunksize=16) if entry]
 
 
-def extract_topics(content: list[dict], max_topics: int = 20) -> list[dict]:
-    """Extract main topics from content."""
+def extract_topics(sentences: list[str], max_topics: int = 20) -> list[dict]:
+    """Extract main topics from pre-split sentences."""
     topics = []
-    all_text = " ".join(item["text"] for item in content)
 
     # Extract sentences that look like topic definitions
-    sentences = re.split(r"[.!?]+", all_text)
-
-    topic_indicators = [
-        r"^([A-Z][a-z]+(?:\s+[A-Z]?[a-z]+)*)\s+(?:is|are|refers to|means|defines)",
-        r"(?:The\s+)?([A-Z][a-z]+(?:\s+[a-z]+)*)\s+(?:is defined as|represents|provides)",
-        r"^([A-Z][a-z]+(?:\s+[a-z]+)*)\s*[-:]\s*",
-    ]
+    candidates = _prefilter_sentences(_TOPIC_PREFILTER, sentences)
 
     seen_topics = set()
-    for sentence in sentences:
-        sentence = sentence.strip()
+    for idx, sentence in enumerate(sentences):
+        if candidates is not None and idx not in candidates:
+            continue
         if len(sentence) < 20 or len(sentence) > 500:
             continue
+        if candidates is None and not any(lit in sentence for lit in _TOPIC_LITERALS):
+            continue
 
-        for pattern in topic_indicators:
-            match = re.search(pattern, sentence)
+        for pattern in _TOPIC_INDICATORS:
+            match = pattern.search(sentence)
             if match:
                 topic_name = match.group(1).strip()
                 if topic_name.lower() not in seen_topics and len(topic_name) > 3:
@@ -87,15 +265,26 @@ def extract_topics(content: list[dict], max_topics: int = 20) -> list[dict]:
         if len(topics) >= max_topics:
             break
 
-    # Find related sentences for each topic
+    if not topics:
+        return topics
+
+    # Inverted index: word -> indices of (long enough) sentences containing it
+    postings = defaultdict(list)
+    for idx, sentence in enumerate(sentences):
+        if len(sentence) < 30:
+            continue
+        for word in set(sentence.lower().split()):
+            postings[word].append(idx)
+
+    # Find related sentences for each topic, in document order
     for topic in topics:
         topic_words = set(topic["name"].lower().split())
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 30:
-                continue
-            sentence_words = set(sentence.lower().split())
-            if topic_words & sentence_words and sentence != topic["description"]:
+        matches = set()
+        for word in topic_words:
+            matches.update(postings.get(word, ()))
+        for idx in sorted(matches):
+            sentence = sentences[idx]
+            if sentence != topic["description"]:
                 topic["related_sentences"].append(sentence)
                 if len(topic["related_sentences"]) >= 5:
                     break
@@ -103,59 +292,76 @@ def extract_topics(content: list[dict], max_topics: int = 20) -> list[dict]:
     return topics
 
 
-def extract_definitions(content: list[dict]) -> list[dict]:
-    """Extract key terms and definitions."""
+def extract_definitions(sentences: list[str]) -> list[dict]:
+    """Extract key terms and definitions from pre-split sentences."""
     definitions = []
-    all_text = " ".join(item["text"] for item in content)
-    sentences = re.split(r"[.!?]+", all_text)
-
-    definition_patterns = [
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is defined as\s+(.+)",
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+refers to\s+(.+)",
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+means\s+(.+)",
-        r"([A-Z][a-z]+(?:\s+[a-z]+)*)\s+is\s+(?:a|an|the)\s+(.+)",
-    ]
+    candidates = _prefilter_sentences(_DEFINITION_PREFILTER, sentences)
 
     seen_terms = set()
-    for sentence in sentences:
-        sentence = sentence.strip()
-        for pattern in definition_patterns:
-            match = re.search(pattern, sentence)
-            if match:
-                term = match.group(1).strip()
-                definition = match.group(2).strip()
-                if term.lower() not in seen_terms and len(definition) > 10:
-                    seen_terms.add(term.lower())
-                    definitions.append({
-                        "term": term,
-                        "definition": definition[:200]
-                    })
-                break
+    for idx, sentence in enumerate(sentences):
+        if candidates is not None and idx not in candidates:
+            continue
+        match = _RE_DEFINITION.search(sentence)
+        if not match:
+            continue
+        term, definition = match.group(1), match.group(3)
+
+        # The alternation finds the leftmost phrase, but a higher-priority
+        # pattern matching later in the sentence still wins
+        verb = match.group("verb")
+        rank = _DEFINITION_VERBS.index(verb) if verb in _DEFINITION_VERBS else 3
+        for phrase, pattern in zip(_DEFINITION_VERBS[:rank], _DEFINITION_PATTERNS):
+            if phrase in sentence:
+                earlier = pattern.search(sentence)
+                if earlier:
+                    term, definition = earlier.group(1), earlier.group(2)
+                    break
+
+        term = term.strip()
+        definition = definition.strip()
+        if term.lower() not in seen_terms and len(definition) > 10:
+            seen_terms.add(term.lower())
+            definitions.append({
+                "term": term,
+                "definition": definition[:200]
+            })
 
     return definitions[:30]  # Limit to 30 definitions
 
 
-def extract_key_points(content: list[dict]) -> list[str]:
-    """Extract key points and facts."""
-    key_points = []
-    all_text = " ".join(item["text"] for item in content)
-    sentences = re.split(r"[.!?]+", all_text)
+def extract_key_points(sentences: list[str], max_points: int = 20) -> list[str]:
+    """Extract the key points that mention the most importance keywords.
 
-    importance_keywords = [
-        "important", "key", "essential", "must", "should", "always",
-        "never", "critical", "fundamental", "primary", "main"
-    ]
+    Every qualifying sentence is scored, so the result no longer depends on
+    where in the corpus the first max_points matches happen to sit; ties keep
+    document order.
+    """
+    if pa is not None:
+        matched = _match_key_points_arrow(sentences)
+    else:
+        candidates = _prefilter_sentences(_KEYWORD_PREFILTER, sentences)
+        matched = [
+            sentence for idx, sentence in enumerate(sentences)
+            if (candidates is None or idx in candidates) and 30 <= len(sentence) <= 300
+        ]
 
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if len(sentence) < 30 or len(sentence) > 300:
-            continue
-        if any(kw in sentence.lower() for kw in importance_keywords):
-            key_points.append(sentence)
-            if len(key_points) >= 20:
-                break
+    scored = []
+    for sentence in matched:
+        score = len({kw.lower() for kw in _IMPORTANCE_RE.findall(sentence)})
+        if score:
+            scored.append((score, sentence))
 
-    return key_points
+    return [sentence for _, sentence in heapq.nlargest(max_points, scored, key=itemgetter(0))]
+
+
+def _match_key_points_arrow(sentences: list[str]) -> list[str]:
+    """Length bounds and keyword match as PyArrow kernels over the whole
+    sentence array instead of a Python loop."""
+    arr = pa.array(sentences, type=pa.large_string())
+    lens = pc.utf8_length(arr)
+    arr = pc.filter(arr, pc.and_(pc.greater_equal(lens, 30), pc.less_equal(lens, 300)))
+    hits = pc.match_substring_regex(arr, _KEYWORD_ALTERNATION, ignore_case=True)
+    return pc.filter(arr, hits).to_pylist()
 
 
 def generate_readme(
@@ -171,7 +377,7 @@ def generate_readme(
     if include_toc and topics:
         lines.append("## Table of Contents\n")
         for i, topic in enumerate(topics, 1):
-            safe_name = re.sub(r"[^a-z0-9]+", "-", topic["name"].lower())
+            safe_name = _RE_SLUG.sub("-", topic["name"].lower())
             lines.append(f"{i}. [{topic['name']}](topics/topic_{i:02d}.md)")
         lines.append("")
 
@@ -300,9 +506,10 @@ def generate_summary(
         return {"error": "No content found in input directory"}
 
     # Extract information
-    topics = extract_topics(content, max_topics)
-    definitions = extract_definitions(content)
-    key_points = extract_key_points(content)
+    sentences = split_sentences(content)
+    topics = extract_topics(sentences, max_topics)
+    definitions = extract_definitions(sentences)
+    key_points = extract_key_points(sentences)
 
     if len(topics) < 2 and len(definitions) < 3:
         return {
@@ -335,12 +542,16 @@ def generate_summary(
         (out_path / "glossary.md").write_text(glossary, encoding="utf-8")
         files_created.append("glossary.md")
 
-    # Generate topic files
-    for i, topic in enumerate(topics, 1):
-        topic_content = generate_topic_file(topic, i)
-        topic_file = topics_path / f"topic_{i:02d}.md"
-        topic_file.write_text(topic_content, encoding="utf-8")
-        files_created.append(f"topics/topic_{i:02d}.md")
+    # Generate topic files, overlapping the writes with rendering
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as ex:
+        writes = []
+        for i, topic in enumerate(topics, 1):
+            topic_content = generate_topic_file(topic, i)
+            topic_file = topics_path / f"topic_{i:02d}.md"
+            writes.append(ex.submit(topic_file.write_text, topic_content, encoding="utf-8"))
+            files_created.append(f"topics/topic_{i:02d}.md")
+        for write in writes:
+            write.result()
 
     # Generate quick reference
     quick_ref = generate_quick_reference(topics, definitions, key_points)
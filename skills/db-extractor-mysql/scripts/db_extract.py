@@ -20,8 +20,14 @@ Requires: pip install mysql-connector-python
 
 import argparse
 import csv
+import gzip
+import io
+import itertools
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse, unquote
@@ -29,15 +35,73 @@ from urllib.parse import urlparse, unquote
 try:
     import mysql.connector
     from mysql.connector import Error as MySQLError
+    from mysql.connector import FieldFlag, FieldType
 except ImportError:
     print("ERROR: mysql-connector-python is required.", file=sys.stderr)
     print("Install with: pip install mysql-connector-python", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import orjson  # Optional: faster JSON Lines serialization
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa  # Optional: -f parquet
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import zstandard  # Optional: --compress zstd
+except ImportError:
+    zstandard = None
+
 
 # System databases to exclude from extraction
 SYSTEM_DATABASES = {"mysql", "information_schema", "performance_schema", "sys"}
 
+# Seconds the server waits on a stalled client while streaming a result
+NET_WRITE_TIMEOUT = 600
+
+# Rows pulled per fetchmany() call by the streaming exporters
+FETCH_BATCH_SIZE = 5000
+
+# Write buffer for export files; large enough that big tables cost few syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# JSON export file extension for each --json-mode
+JSON_SUFFIXES = {"lines": ".jsonl", "array": ".json"}
+
+# File suffix added to CSV/JSON exports for each --compress choice
+COMPRESS_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+# Result field types the driver hands back as bytes when their character set
+# is binary (TEXT/CHAR share these codes but arrive decoded)
+BINARY_CHARSET = 63
+BLOB_FIELD_TYPES = {
+    FieldType.TINY_BLOB, FieldType.MEDIUM_BLOB, FieldType.LONG_BLOB,
+    FieldType.BLOB, FieldType.VAR_STRING, FieldType.STRING,
+}
+
+# Arrow type (pyarrow factory and arguments) for result field types in
+# Parquet exports; columns of any other type are stored as text
+PARQUET_TYPES = {
+    FieldType.TINY: ("int64",),
+    FieldType.SHORT: ("int64",),
+    FieldType.INT24: ("int64",),
+    FieldType.LONG: ("int64",),
+    FieldType.LONGLONG: ("int64",),
+    FieldType.YEAR: ("int64",),
+    FieldType.BIT: ("uint64",),
+    FieldType.FLOAT: ("float32",),
+    FieldType.DOUBLE: ("float64",),
+    FieldType.DATE: ("date32",),
+    FieldType.NEWDATE: ("date32",),
+    FieldType.DATETIME: ("timestamp", "us"),
+    FieldType.TIMESTAMP: ("timestamp", "us"),
+}
+
 
 def parse_connection_string(uri: str) -> dict:
     """
@@ -70,10 +134,21 @@ def parse_connection_string(uri: str) -> dict:
     }
 
 
-def get_connection(connection_string: str, charset: str = "utf8mb4", timeout: int = 30):
-    """Create MySQL database connection."""
+def get_connection(connection_string: str, charset: str = "utf8mb4", timeout: int = 30,
+                   use_pure: bool = False, query_timeout: int = 0):
+    """Create MySQL database connection.
+
+    The driver picks its C extension when it can load it and falls back to
+    pure Python otherwise; use_pure forces the pure-Python implementation.
+    query_timeout (seconds, 0 = none) caps each SELECT via MAX_EXECUTION_TIME.
+    """
     config = parse_connection_string(connection_string)
 
+    options = {}
+    if use_pure:
+        # Passing use_pure=False would make a missing C extension an error
+        options["use_pure"] = True
+
     conn = mysql.connector.connect(
         host=config["host"],
         port=config["port"],
@@ -82,9 +157,18 @@ def get_connection(connection_string: str, charset: str = "utf8mb4", timeout: in
         database=config["database"],
         charset=charset,
         connection_timeout=timeout,
-        use_pure=True,  # Pure Python implementation for compatibility
+        **options,
     )
 
+    cursor = conn.cursor()
+    # Unbuffered exports keep the server writing for as long as the client
+    # takes to consume the table; don't drop slow (e.g. compressing) readers
+    # after the default 60 seconds
+    cursor.execute("SET SESSION net_write_timeout = %s", (NET_WRITE_TIMEOUT,))
+    if query_timeout:
+        cursor.execute("SET SESSION MAX_EXECUTION_TIME = %s", (query_timeout * 1000,))
+    cursor.close()
+
     return conn
 
 
@@ -127,11 +211,15 @@ def get_schema(conn, table: str) -> list[dict]:
     return schema
 
 
+def _quote_name(name: str) -> str:
+    """Backtick-quote a MySQL identifier."""
+    return "`" + name.replace("`", "``") + "`"
+
+
 def get_row_count(conn, table: str) -> int:
     """Get row count for a table."""
     cursor = conn.cursor()
-    # Use backticks for table names with special characters
-    cursor.execute(f"SELECT COUNT(*) FROM `{table}`")
+    cursor.execute(f"SELECT COUNT(*) FROM {_quote_name(table)}")
     count = cursor.fetchone()[0]
     cursor.close()
     return count
@@ -154,107 +242,356 @@ def get_table_info(conn, table: str) -> dict:
     return {}
 
 
-def export_to_csv(conn, table: str, output_dir: Path) -> Path:
-    """Export table to CSV file."""
-    output_file = output_dir / f"{table}.csv"
-
+def get_schemas(conn, tables: list[str]) -> dict[str, list[dict]]:
+    """Column info for many tables from one INFORMATION_SCHEMA query."""
     cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM `{table}`")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
-    cursor.close()
+    cursor.execute("""
+        SELECT
+            TABLE_NAME,
+            COLUMN_NAME,
+            COLUMN_TYPE,
+            IS_NULLABLE,
+            COLUMN_KEY,
+            EXTRA
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """)
 
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(columns)
+    schemas = {table: [] for table in tables}
+    for table, rows in itertools.groupby(cursor.fetchall(), key=lambda row: row[0]):
+        if table not in schemas:
+            continue
         for row in rows:
-            # Handle bytes/BLOB data
-            processed_row = []
-            for cell in row:
-                if isinstance(cell, bytes):
-                    processed_row.append(f"[BINARY:{len(cell)} bytes]")
-                else:
-                    processed_row.append(cell)
-            writer.writerow(processed_row)
+            schemas[table].append({
+                "name": row[1],
+                "type": row[2],
+                "nullable": row[3] == "YES",
+                "primary_key": row[4] == "PRI",
+                "auto_increment": "auto_increment" in (row[5] or "").lower(),
+            })
+
+    cursor.close()
+    return schemas
 
-    return output_file
 
+def get_row_counts(conn, tables: list[str]) -> dict[str, int]:
+    """Exact row counts for many tables in a single UNION ALL round-trip."""
+    if not tables:
+        return {}
+    # '%' is escaped since the query also carries parameters
+    union = " UNION ALL ".join(
+        "SELECT %s, COUNT(*) FROM " + _quote_name(table).replace("%", "%%")
+        for table in tables
+    )
+    cursor = conn.cursor()
+    cursor.execute(union, tuple(tables))
+    counts = dict(cursor.fetchall())
+    cursor.close()
+    return counts
 
-def export_to_json(conn, table: str, output_dir: Path) -> Path:
-    """Export table to JSON file."""
-    output_file = output_dir / f"{table}.json"
 
+def get_table_infos(conn) -> dict[str, dict]:
+    """Engine/collation for every table in the database in one query."""
     cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM `{table}`")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
+    cursor.execute("""
+        SELECT TABLE_NAME, ENGINE, TABLE_COLLATION
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = DATABASE()
+    """)
+    infos = {row[0]: {"engine": row[1], "collation": row[2]} for row in cursor.fetchall()}
     cursor.close()
+    return infos
+
+
+@contextmanager
+def _open_output(path: Path, compress: str = "none", text: bool = True, newline: Optional[str] = None):
+    """
+    Open an export file for writing through a 1 MiB buffer.
 
-    data = []
+    compress wraps the file in gzip (level 1) or zstd (level 3); text=False
+    yields the binary stream, e.g. for COPY output.
+    """
+    with ExitStack() as stack:
+        f = stack.enter_context(open(path, "wb", buffering=OUTPUT_BUFFER_SIZE))
+        if compress == "gzip":
+            f = stack.enter_context(gzip.GzipFile(fileobj=f, mode="wb", compresslevel=1))
+        elif compress == "zstd":
+            f = stack.enter_context(zstandard.ZstdCompressor(level=3).stream_writer(f))
+        if text:
+            f = stack.enter_context(io.TextIOWrapper(f, encoding="utf-8", newline=newline))
+        yield f
+
+
+def _fetch_rows(cursor, size: int = FETCH_BATCH_SIZE):
+    """
+    Iterate a cursor's result rows, fetching them size at a time.
+
+    The C extension decodes a whole fetchmany() batch in one call, where
+    plain iteration goes through fetchone() for every row.
+    """
+    while True:
+        batch = cursor.fetchmany(size)
+        if not batch:
+            return
+        yield from batch
+
+
+def _binary_columns(description) -> list[int]:
+    """
+    Indices of result columns whose values arrive as raw bytes.
+
+    Uses the driver's own test, the binary character set; the BINARY flag is
+    also set on text columns with a _bin collation (utf8mb4_bin), which arrive
+    decoded. Drivers that do not report the character set get every column
+    of these types, and _mask_binary only touches the cells that are bytes.
+    """
+    return [
+        i for i, desc in enumerate(description)
+        if desc[1] == FieldType.GEOMETRY
+        or (desc[1] in BLOB_FIELD_TYPES and (len(desc) < 9 or desc[8] == BINARY_CHARSET))
+    ]
+
+
+def _mask_binary(rows, binary_columns: list[int]):
+    """
+    Yield rows with binary cells replaced by a [BINARY:n bytes] marker.
+
+    Only the columns picked out by _binary_columns are touched, so tables
+    without BLOB/BINARY columns pass straight through.
+    """
+    if not binary_columns:
+        yield from rows
+        return
     for row in rows:
-        record = {}
-        for col, cell in zip(columns, row):
-            if isinstance(cell, bytes):
-                record[col] = f"[BINARY:{len(cell)} bytes]"
-            else:
-                record[col] = cell
-        data.append(record)
+        row = list(row)
+        for i in binary_columns:
+            if isinstance(row[i], bytes):
+                row[i] = f"[BINARY:{len(row[i])} bytes]"
+        yield row
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
 
-    return output_file
+def export_to_csv(conn, table: str, output_dir: Path, compress: str = "none") -> tuple[Path, int]:
+    """Export table to CSV file. Returns the file and the number of rows written."""
+    output_file = output_dir / f"{table}.csv{COMPRESS_SUFFIXES[compress]}"
 
+    # Unbuffered cursor: rows stream from the server instead of being
+    # materialized client-side, so memory stays flat on large tables
+    cursor = conn.cursor(buffered=False)
+    cursor.execute(f"SELECT * FROM {_quote_name(table)}")
+    columns = [desc[0] for desc in cursor.description]
 
-def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100) -> Path:
-    """Export table to Markdown file with table format."""
-    output_file = output_dir / f"{table}.md"
+    try:
+        with _open_output(output_file, compress, newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            # zip pulls a row before a number, so the counter only advances
+            # for rows that were actually written
+            counter = itertools.count()
+            rows = _mask_binary(_fetch_rows(cursor), _binary_columns(cursor.description))
+            writer.writerows(row for row, _ in zip(rows, counter))
+        rows_written = next(counter)
+    finally:
+        cursor.close()
+
+    return output_file, rows_written
+
+
+def _write_json_array(f, records) -> None:
+    """
+    Write records to f as a JSON array, one element at a time.
 
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM `{table}`")
+    Produces the same text as json.dump(list(records), f, indent=2,
+    default=str) without ever holding the whole list.
+    """
+    first = True
+    for record in records:
+        f.write("[\n  " if first else ",\n  ")
+        # json.dumps escapes newlines inside strings, so every "\n" here is
+        # indentation and can be shifted one level for the enclosing array
+        f.write(json.dumps(record, indent=2, default=str).replace("\n", "\n  "))
+        first = False
+    f.write("[]" if first else "\n]")
+
+
+def _write_json_lines(f, records) -> None:
+    """
+    Write records to the binary stream f as JSON Lines, one object per line.
+
+    orjson is used when installed; datetimes are passed through to default=str
+    so both paths produce the same text.
+    """
+    if orjson is not None:
+        options = orjson.OPT_APPEND_NEWLINE | orjson.OPT_PASSTHROUGH_DATETIME
+        for record in records:
+            f.write(orjson.dumps(record, default=str, option=options))
+    else:
+        for record in records:
+            line = json.dumps(record, default=str, ensure_ascii=False, separators=(",", ":"))
+            f.write(line.encode("utf-8") + b"\n")
+
+
+def export_to_json(conn, table: str, output_dir: Path, compress: str = "none",
+                   json_mode: str = "lines") -> tuple[Path, int]:
+    """
+    Export table to a JSON Lines file, or a JSON array with json_mode="array".
+
+    Returns the file and the number of rows written.
+    """
+    output_file = output_dir / f"{table}{JSON_SUFFIXES[json_mode]}{COMPRESS_SUFFIXES[compress]}"
+
+    cursor = conn.cursor(buffered=False)
+    cursor.execute(f"SELECT * FROM {_quote_name(table)}")
     columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
-    cursor.close()
 
-    total_rows = len(rows)
-    display_rows = rows[:max_rows]
-
-    lines = [f"# {table}", ""]
-
-    # Add row count info
-    lines.append(f"**Rows:** {total_rows}")
-    if total_rows > max_rows:
-        lines.append(f"*(showing first {max_rows} rows)*")
-    lines.append("")
-
-    # Create markdown table
-    if columns and display_rows:
-        # Header
-        lines.append("| " + " | ".join(columns) + " |")
-        lines.append("| " + " | ".join(["---"] * len(columns)) + " |")
-
-        # Rows
-        for row in display_rows:
-            cells = []
-            for cell in row:
-                if isinstance(cell, bytes):
-                    cells.append(f"[BINARY:{len(cell)}B]")
-                else:
-                    # Escape pipes and truncate long content
-                    cell_str = str(cell).replace("|", "\\|").replace("\n", " ")[:100]
-                    cells.append(cell_str)
-            lines.append("| " + " | ".join(cells) + " |")
+    rows_written = 0
+
+    def records():
+        nonlocal rows_written
+        for row in _mask_binary(_fetch_rows(cursor), _binary_columns(cursor.description)):
+            rows_written += 1
+            yield dict(zip(columns, row))
+
+    # Rows are serialized as they arrive instead of collected into one list
+    try:
+        if json_mode == "lines":
+            with _open_output(output_file, compress, text=False) as f:
+                _write_json_lines(f, records())
+        else:
+            with _open_output(output_file, compress) as f:
+                _write_json_array(f, records())
+    finally:
+        cursor.close()
+
+    return output_file, rows_written
+
+
+def _text_value(value) -> str:
+    """Text form of a value stored in a Parquet string column."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str, ensure_ascii=False)
+    return str(value)
+
+
+def export_to_parquet(conn, table: str, output_dir: Path) -> tuple[Path, int]:
+    """
+    Export table to a zstd-compressed Parquet file.
+
+    Numbers, dates and timestamps keep their types; everything else is
+    stored as text, with binary columns as a [BINARY:n bytes] marker like
+    the other formats. Rows are written one FETCH_BATCH_SIZE record batch at
+    a time. Returns the file and the number of rows written.
+    """
+    output_file = output_dir / f"{table}.parquet"
+
+    cursor = conn.cursor(buffered=False)
+    cursor.execute(f"SELECT * FROM {_quote_name(table)}")
+    columns = [desc[0] for desc in cursor.description]
+
+    types = []
+    for desc in cursor.description:
+        factory, *type_args = PARQUET_TYPES.get(desc[1], ("string",))
+        if desc[1] == FieldType.LONGLONG and desc[7] & FieldFlag.UNSIGNED:
+            factory = "uint64"
+        types.append(getattr(pa, factory)(*type_args))
+    arrow_schema = pa.schema(list(zip(columns, types)))
+
+    rows_written = 0
+    try:
+        binary_columns = _binary_columns(cursor.description)
+        with pq.ParquetWriter(output_file, arrow_schema, compression="zstd") as writer:
+            while batch := cursor.fetchmany(FETCH_BATCH_SIZE):
+                arrays = []
+                for values, arrow_type in zip(zip(*_mask_binary(batch, binary_columns)), types):
+                    if arrow_type == pa.string():
+                        values = [
+                            v if v is None or v.__class__ is str else _text_value(v)
+                            for v in values
+                        ]
+                    arrays.append(pa.array(values, type=arrow_type))
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=arrow_schema))
+                rows_written += len(batch)
+    finally:
+        cursor.close()
+
+    return output_file, rows_written
+
+
+def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100,
+                       total_rows: Optional[int] = None) -> tuple[Path, int]:
+    """
+    Export table to Markdown file with table format. Returns the file and row count.
+
+    When total_rows is already known, e.g. from another format's export of
+    the same table, only the displayed rows are read.
+    """
+    output_file = output_dir / f"{table}.md"
+
+    if total_rows is not None:
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT * FROM {_quote_name(table)} LIMIT {int(max_rows)}")
+        columns = [desc[0] for desc in cursor.description]
+        display_rows = cursor.fetchall()
+        cursor.close()
     else:
-        lines.append("*Empty table*")
+        # Keep only the rows that get displayed; the rest are counted as
+        # they stream past rather than held in memory
+        cursor = conn.cursor(buffered=False)
+        cursor.execute(f"SELECT * FROM {_quote_name(table)}")
+        columns = [desc[0] for desc in cursor.description]
+
+        display_rows = []
+        total_rows = 0
+        try:
+            for row in _fetch_rows(cursor):
+                if total_rows < max_rows:
+                    display_rows.append(row)
+                total_rows += 1
+        finally:
+            cursor.close()
+
+    # Lines go straight to the file; the last one has no trailing newline
+    with _open_output(output_file) as f:
+        w = f.write
+        w(f"# {table}\n\n")
+
+        # Add row count info
+        w(f"**Rows:** {total_rows}\n")
+        if total_rows > max_rows:
+            w(f"*(showing first {max_rows} rows)*\n")
+        w("\n")
+
+        # Create markdown table
+        if columns and display_rows:
+            # Header
+            w("| " + " | ".join(columns) + " |\n")
+            w("| " + " | ".join(["---"] * len(columns)) + " |")
+
+            # Rows
+            for row in display_rows:
+                cells = []
+                for cell in row:
+                    if isinstance(cell, bytes):
+                        cells.append(f"[BINARY:{len(cell)}B]")
+                    else:
+                        # Escape pipes and truncate long content
+                        cell_str = str(cell).replace("|", "\\|").replace("\n", " ")[:100]
+                        cells.append(cell_str)
+                w("\n| " + " | ".join(cells) + " |")
+        else:
+            w("*Empty table*")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    return output_file, total_rows
 
-    return output_file
 
+def export_schema_info(conn, tables: list[str], output_dir: Path,
+                       row_counts: Optional[dict[str, int]] = None) -> Path:
+    """
+    Export database schema as Markdown documentation.
 
-def export_schema_info(conn, tables: list[str], output_dir: Path) -> Path:
-    """Export database schema as Markdown documentation."""
+    row_counts, e.g. as reported by the exporters, saves counting every table
+    again; without it the counts are queried.
+    """
     output_file = output_dir / "_schema.md"
 
     # Get database name
@@ -263,31 +600,35 @@ def export_schema_info(conn, tables: list[str], output_dir: Path) -> Path:
     db_name = cursor.fetchone()[0]
     cursor.close()
 
-    lines = [f"# Database Schema: {db_name}", ""]
-
-    for table in tables:
-        schema = get_schema(conn, table)
-        row_count = get_row_count(conn, table)
-        table_info = get_table_info(conn, table)
-
-        lines.append(f"## {table}")
-        lines.append(f"**Rows:** {row_count}")
-        if table_info.get("engine"):
-            lines.append(f"**Engine:** {table_info['engine']}")
-        lines.append("")
-        lines.append("| Column | Type | Nullable | Primary Key | Auto-Inc |")
-        lines.append("| --- | --- | --- | --- | --- |")
-
-        for col in schema:
-            pk = "✓" if col["primary_key"] else ""
-            nullable = "✓" if col["nullable"] else ""
-            auto_inc = "✓" if col["auto_increment"] else ""
-            lines.append(f"| {col['name']} | {col['type']} | {nullable} | {pk} | {auto_inc} |")
+    # Metadata for every table comes from three batched queries
+    schemas = get_schemas(conn, tables)
+    if row_counts is None:
+        row_counts = get_row_counts(conn, tables)
+    table_infos = get_table_infos(conn)
 
-        lines.append("")
+    # Each table's section starts with the blank line that ends the previous one
+    with _open_output(output_file) as f:
+        w = f.write
+        w(f"# Database Schema: {db_name}\n")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        for table in tables:
+            schema = schemas[table]
+            row_count = row_counts[table]
+            table_info = table_infos.get(table, {})
+
+            w(f"\n## {table}\n")
+            w(f"**Rows:** {row_count}\n")
+            if table_info.get("engine"):
+                w(f"**Engine:** {table_info['engine']}\n")
+            w("\n")
+            w("| Column | Type | Nullable | Primary Key | Auto-Inc |\n")
+            w("| --- | --- | --- | --- | --- |\n")
+
+            for col in schema:
+                pk = "✓" if col["primary_key"] else ""
+                nullable = "✓" if col["nullable"] else ""
+                auto_inc = "✓" if col["auto_increment"] else ""
+                w(f"| {col['name']} | {col['type']} | {nullable} | {pk} | {auto_inc} |\n")
 
     return output_file
 
@@ -323,9 +664,9 @@ Examples:
     parser.add_argument("-o", "--output",
                         help="Output directory (default: current directory)")
     parser.add_argument("-f", "--format",
-                        choices=["csv", "json", "markdown", "all"],
+                        choices=["csv", "json", "markdown", "parquet", "all"],
                         default="csv",
-                        help="Output format (default: csv)")
+                        help="Output format; all = csv, json and markdown (default: csv)")
     parser.add_argument("--tables",
                         help="Comma-separated list of tables (default: all)")
     parser.add_argument("--exclude",
@@ -338,11 +679,31 @@ Examples:
                         help="Character set (default: utf8mb4)")
     parser.add_argument("--timeout", type=int, default=30,
                         help="Connection timeout in seconds (default: 30)")
+    parser.add_argument("--query-timeout", type=int, default=0,
+                        help="Per-query timeout in seconds, 0 = none (default: 0)")
+    parser.add_argument("--pure-python", action="store_true",
+                        help="Use the pure-Python driver instead of its C extension")
+    parser.add_argument("--json-mode", choices=list(JSON_SUFFIXES), default="lines",
+                        help="JSON Lines (.jsonl) or a single JSON array (.json) (default: lines)")
+    parser.add_argument("--compress", choices=list(COMPRESS_SUFFIXES), default="none",
+                        help="Compress CSV/JSON output (default: none)")
+    parser.add_argument("-w", "--workers", type=int, default=8,
+                        help="Tables exported in parallel, one connection each (default: 8)")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
 
     args = parser.parse_args()
 
+    if args.format == "parquet" and pa is None:
+        print("ERROR: -f parquet requires pyarrow.", file=sys.stderr)
+        print("Install with: pip install pyarrow", file=sys.stderr)
+        sys.exit(1)
+
+    if args.compress == "zstd" and zstandard is None:
+        print("ERROR: --compress zstd requires zstandard.", file=sys.stderr)
+        print("Install with: pip install zstandard", file=sys.stderr)
+        sys.exit(1)
+
     def log(msg):
         if not args.quiet:
             print(msg)
@@ -350,7 +711,8 @@ Examples:
     try:
         # Connect to database
         log(f"Connecting: {args.connection.split('@')[0].split(':')[0]}://***@{args.connection.split('@')[-1]}")
-        conn = get_connection(args.connection, charset=args.charset, timeout=args.timeout)
+        conn = get_connection(args.connection, charset=args.charset, timeout=args.timeout,
+                              use_pure=args.pure_python, query_timeout=args.query_timeout)
 
         # Get tables
         all_tables = get_tables(conn)
@@ -378,28 +740,56 @@ Examples:
         # Determine formats to export
         formats = ["csv", "json", "markdown"] if args.format == "all" else [args.format]
 
-        # Export each table
-        for table in tables:
-            row_count = get_row_count(conn, table)
-            log(f"  {table} ({row_count} rows)")
-
+        subdirs = {}
+        for fmt in formats:
+            subdirs[fmt] = output_dir / fmt if len(formats) > 1 else output_dir
+            subdirs[fmt].mkdir(exist_ok=True)
+
+        # Tables are independent, so export them concurrently. Connections
+        # are not thread-safe: each worker opens its own on first use.
+        worker_local = threading.local()
+        worker_conns = []
+        row_counts = {}
+
+        def export_table(table):
+            wconn = getattr(worker_local, "conn", None)
+            if wconn is None:
+                wconn = worker_local.conn = get_connection(
+                    args.connection, charset=args.charset, timeout=args.timeout,
+                    use_pure=args.pure_python, query_timeout=args.query_timeout,
+                )
+                worker_conns.append(wconn)
+
+            # Every exporter reads the whole table, so the row count comes
+            # with the export instead of from a separate COUNT(*)
+            row_count = None
             for fmt in formats:
                 if fmt == "csv":
-                    subdir = output_dir / "csv" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_csv(conn, table, subdir)
+                    _, row_count = export_to_csv(wconn, table, subdirs[fmt], args.compress)
                 elif fmt == "json":
-                    subdir = output_dir / "json" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_json(conn, table, subdir)
+                    _, row_count = export_to_json(wconn, table, subdirs[fmt], args.compress,
+                                                  args.json_mode)
                 elif fmt == "markdown":
-                    subdir = output_dir / "markdown" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_markdown(conn, table, subdir, args.max_rows)
+                    # With -f all the count is known by now, so only the
+                    # displayed rows are fetched
+                    _, row_count = export_to_markdown(wconn, table, subdirs[fmt], args.max_rows,
+                                                      row_count)
+                elif fmt == "parquet":
+                    _, row_count = export_to_parquet(wconn, table, subdirs[fmt])
+            return table, row_count
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(tables)))) as executor:
+                for table, row_count in executor.map(export_table, tables):
+                    row_counts[table] = row_count
+                    log(f"  {table} ({row_count} rows)")
+        finally:
+            for wconn in worker_conns:
+                wconn.close()
 
         # Export schema if requested
         if args.schema:
-            schema_file = export_schema_info(conn, tables, output_dir)
+            schema_file = export_schema_info(conn, tables, output_dir, row_counts)
             log(f"  Schema -> {schema_file}")
 
         conn.close()
@@ -20,8 +20,14 @@ Requires: pip install psycopg2-binary
 
 import argparse
 import csv
+import gzip
+import io
+import itertools
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse, unquote
@@ -29,15 +35,53 @@ from urllib.parse import urlparse, unquote
 try:
     import psycopg2
     from psycopg2 import Error as PostgreSQLError
+    from psycopg2.extensions import quote_ident
 except ImportError:
     print("ERROR: psycopg2 is required.", file=sys.stderr)
     print("Install with: pip install psycopg2-binary", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import pyarrow as pa  # Optional: -f parquet
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+try:
+    import zstandard  # Optional: --compress zstd
+except ImportError:
+    zstandard = None
+
 
 # System schemas to exclude from extraction
 SYSTEM_SCHEMAS = {"pg_catalog", "information_schema", "pg_toast"}
 
+# Write buffer for export files; large enough that big tables cost few syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# JSON export file extension for each --json-mode
+JSON_SUFFIXES = {"lines": ".jsonl", "array": ".json"}
+
+# File suffix added to CSV/JSON exports for each --compress choice
+COMPRESS_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+
+# Rows fetched per round-trip by the server-side export cursors
+EXPORT_ITERSIZE = 5000
+
+# Arrow type (pyarrow factory and arguments) for PostgreSQL type OIDs in
+# Parquet exports; columns of any other type are stored as text
+PARQUET_TYPES = {
+    16: ("bool_",),
+    20: ("int64",),
+    21: ("int16",),
+    23: ("int32",),
+    700: ("float32",),
+    701: ("float64",),
+    1082: ("date32",),
+    1114: ("timestamp", "us"),
+    1184: ("timestamp", "us", "UTC"),
+}
+
 
 def parse_connection_string(uri: str) -> dict:
     """
@@ -70,8 +114,13 @@ def parse_connection_string(uri: str) -> dict:
     }
 
 
-def get_connection(connection_string: str, timeout: int = 30):
-    """Create PostgreSQL database connection."""
+def get_connection(connection_string: str, timeout: int = 30, query_timeout: int = 0):
+    """
+    Create PostgreSQL database connection.
+
+    TCP keepalives let a long export notice a dead server instead of
+    blocking forever; query_timeout (seconds, 0 = none) caps each statement.
+    """
     config = parse_connection_string(connection_string)
 
     conn = psycopg2.connect(
@@ -81,7 +130,15 @@ def get_connection(connection_string: str, timeout: int = 30):
         password=config["password"],
         dbname=config["database"],
         connect_timeout=timeout,
+        keepalives=1,
+        keepalives_idle=30,
+        keepalives_interval=10,
+        keepalives_count=5,
+        options=f"-c statement_timeout={query_timeout * 1000}",
     )
+    # Exports only read; this also lets the named cursors run inside the
+    # implicit transaction psycopg2 opens
+    conn.set_session(readonly=True)
 
     return conn
 
@@ -115,6 +172,7 @@ def get_schema(conn, table: str, schema: str = "public") -> list[dict]:
           AND table_name = %s
         ORDER BY ordinal_position
     """, (schema, table))
+    columns = cursor.fetchall()
 
     # Get primary key columns
     cursor.execute("""
@@ -129,20 +187,8 @@ def get_schema(conn, table: str, schema: str = "public") -> list[dict]:
     """, (schema, table))
     pk_columns = {row[0] for row in cursor.fetchall()}
 
-    cursor.execute("""
-        SELECT
-            column_name,
-            data_type,
-            is_nullable,
-            column_default
-        FROM information_schema.columns
-        WHERE table_schema = %s
-          AND table_name = %s
-        ORDER BY ordinal_position
-    """, (schema, table))
-
     schema_info = []
-    for row in cursor.fetchall():
+    for row in columns:
         col_default = row[3] or ""
         schema_info.append({
             "name": row[0],
@@ -156,10 +202,15 @@ def get_schema(conn, table: str, schema: str = "public") -> list[dict]:
     return schema_info
 
 
+def _table_ref(conn, table: str, schema: str) -> str:
+    """Quoted "schema"."table" reference, safe to interpolate into SQL."""
+    return f"{quote_ident(schema, conn)}.{quote_ident(table, conn)}"
+
+
 def get_row_count(conn, table: str, schema: str = "public") -> int:
     """Get row count for a table."""
     cursor = conn.cursor()
-    cursor.execute(f'SELECT COUNT(*) FROM "{schema}"."{table}"')
+    cursor.execute(f"SELECT COUNT(*) FROM {_table_ref(conn, table, schema)}")
     count = cursor.fetchone()[0]
     cursor.close()
     return count
@@ -170,7 +221,7 @@ def get_table_info(conn, table: str, schema: str = "public") -> dict:
     cursor = conn.cursor()
     cursor.execute("""
         SELECT pg_size_pretty(pg_total_relation_size(%s::regclass))
-    """, (f"{schema}.{table}",))
+    """, (_table_ref(conn, table, schema),))
     row = cursor.fetchone()
     cursor.close()
 
@@ -179,107 +230,371 @@ def get_table_info(conn, table: str, schema: str = "public") -> dict:
     return {}
 
 
-def export_to_csv(conn, table: str, output_dir: Path, schema: str = "public") -> Path:
-    """Export table to CSV file."""
-    output_file = output_dir / f"{table}.csv"
-
+def get_schemas(conn, tables: list[str], schema: str = "public") -> dict[str, list[dict]]:
+    """Column info for many tables at once (two queries total, not 3 per table)."""
     cursor = conn.cursor()
-    cursor.execute(f'SELECT * FROM "{schema}"."{table}"')
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
-    cursor.close()
+    cursor.execute("""
+        SELECT c.relname, a.attname
+        FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+        JOIN pg_class c ON c.oid = i.indrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE i.indisprimary
+          AND n.nspname = %s
+          AND c.relname = ANY(%s)
+    """, (schema, tables))
+    pk_columns = {(row[0], row[1]) for row in cursor.fetchall()}
+
+    cursor.execute("""
+        SELECT
+            table_name,
+            column_name,
+            data_type,
+            is_nullable,
+            column_default
+        FROM information_schema.columns
+        WHERE table_schema = %s
+          AND table_name = ANY(%s)
+        ORDER BY table_name, ordinal_position
+    """, (schema, tables))
 
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(columns)
+    schemas = {table: [] for table in tables}
+    for table, rows in itertools.groupby(cursor.fetchall(), key=lambda row: row[0]):
         for row in rows:
-            # Handle bytes/bytea data
-            processed_row = []
-            for cell in row:
-                if isinstance(cell, (bytes, memoryview)):
-                    processed_row.append(f"[BINARY:{len(cell)} bytes]")
-                else:
-                    processed_row.append(cell)
-            writer.writerow(processed_row)
+            col_default = row[4] or ""
+            schemas[table].append({
+                "name": row[1],
+                "type": row[2],
+                "nullable": row[3] == "YES",
+                "primary_key": (table, row[1]) in pk_columns,
+                "auto_increment": "nextval(" in col_default.lower() if col_default else False,
+            })
 
-    return output_file
+    cursor.close()
+    return schemas
 
 
-def export_to_json(conn, table: str, output_dir: Path, schema: str = "public") -> Path:
-    """Export table to JSON file."""
-    output_file = output_dir / f"{table}.json"
+def get_row_counts(conn, tables: list[str], schema: str = "public") -> dict[str, int]:
+    """Exact row counts for many tables in a single UNION ALL round-trip."""
+    if not tables:
+        return {}
+    # '%' is escaped since the query also carries parameters
+    union = " UNION ALL ".join(
+        "SELECT %s, COUNT(*) FROM " + _table_ref(conn, table, schema).replace("%", "%%")
+        for table in tables
+    )
+    cursor = conn.cursor()
+    cursor.execute(union, tables)
+    counts = dict(cursor.fetchall())
+    cursor.close()
+    return counts
+
 
+def get_table_infos(conn, tables: list[str], schema: str = "public") -> dict[str, dict]:
+    """Size metadata for many tables in one query."""
     cursor = conn.cursor()
-    cursor.execute(f'SELECT * FROM "{schema}"."{table}"')
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
+    cursor.execute("""
+        SELECT c.relname, pg_size_pretty(pg_total_relation_size(c.oid))
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = %s
+          AND c.relname = ANY(%s)
+    """, (schema, tables))
+    infos = {row[0]: {"size": row[1]} for row in cursor.fetchall()}
     cursor.close()
+    return infos
 
-    data = []
-    for row in rows:
-        record = {}
-        for col, cell in zip(columns, row):
-            if isinstance(cell, (bytes, memoryview)):
-                record[col] = f"[BINARY:{len(cell)} bytes]"
-            else:
-                record[col] = cell
-        data.append(record)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+def _stream_table(conn, table: str, schema: str, limit: Optional[int] = None):
+    """
+    Run SELECT * on a table through a server-side (named) cursor, returning
+    at most limit rows if given.
 
-    return output_file
+    Returns (cursor, columns, rows), where rows yields every row while only
+    EXPORT_ITERSIZE rows are held client-side at a time. psycopg2 fills in
+    description for named cursors only after a fetch, so the first batch is
+    pulled here. The caller closes the cursor.
+    """
+    cursor = conn.cursor(name=f"export_{table}")
+    cursor.itersize = EXPORT_ITERSIZE
+    query = f"SELECT * FROM {_table_ref(conn, table, schema)}"
+    if limit is not None:
+        query += f" LIMIT {int(limit)}"
+    cursor.execute(query)
+    first = cursor.fetchmany(EXPORT_ITERSIZE)
+    columns = [desc[0] for desc in cursor.description]
+    return cursor, columns, itertools.chain(first, cursor)
 
 
-def export_to_markdown(conn, table: str, output_dir: Path, schema: str = "public", max_rows: int = 100) -> Path:
-    """Export table to Markdown file with table format."""
-    output_file = output_dir / f"{table}.md"
+@contextmanager
+def _open_output(path: Path, compress: str = "none", text: bool = True, newline: Optional[str] = None):
+    """
+    Open an export file for writing through a 1 MiB buffer.
+
+    compress wraps the file in gzip (level 1) or zstd (level 3); text=False
+    yields the binary stream, e.g. for COPY output.
+    """
+    with ExitStack() as stack:
+        f = stack.enter_context(open(path, "wb", buffering=OUTPUT_BUFFER_SIZE))
+        if compress == "gzip":
+            f = stack.enter_context(gzip.GzipFile(fileobj=f, mode="wb", compresslevel=1))
+        elif compress == "zstd":
+            f = stack.enter_context(zstandard.ZstdCompressor(level=3).stream_writer(f))
+        if text:
+            f = stack.enter_context(io.TextIOWrapper(f, encoding="utf-8", newline=newline))
+        yield f
+
+
+def _export_query(cursor, table: str, schema: str) -> str:
+    """
+    SELECT for a table's export with bytea columns replaced in SQL by a
+    [BINARY:n bytes] marker, for server-side formatting with COPY.
+    """
+    table_ref = _table_ref(cursor, table, schema)
+    cursor.execute(f"SELECT * FROM {table_ref} LIMIT 0")
+    select_list = []
+    for desc in cursor.description:
+        column = quote_ident(desc.name, cursor)
+        if desc.type_code in psycopg2.BINARY.values:
+            select_list.append(
+                f"CASE WHEN {column} IS NULL THEN NULL "
+                f"ELSE '[BINARY:' || octet_length({column}) || ' bytes]' END AS {column}"
+            )
+        else:
+            select_list.append(column)
+
+    return f'SELECT {", ".join(select_list)} FROM {table_ref}'
+
+
+def export_to_csv(conn, table: str, output_dir: Path, schema: str = "public",
+                  compress: str = "none") -> tuple[Path, int]:
+    """Export table to CSV file with COPY ... TO STDOUT.
+
+    The server formats the CSV itself, so no values are converted to Python
+    objects; bytea columns are replaced by a [BINARY:n bytes] marker in SQL.
+    Returns the file and the number of rows written.
+    """
+    output_file = output_dir / f"{table}.csv{COMPRESS_SUFFIXES[compress]}"
 
     cursor = conn.cursor()
-    cursor.execute(f'SELECT * FROM "{schema}"."{table}"')
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
-    cursor.close()
+    try:
+        query = _export_query(cursor, table, schema)
+        with _open_output(output_file, compress, text=False) as f:
+            cursor.copy_expert(
+                f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER, ENCODING 'UTF8')", f
+            )
+        rows_written = cursor.rowcount  # from the server's "COPY n" status
+    finally:
+        cursor.close()
+
+    return output_file, rows_written
+
 
-    total_rows = len(rows)
-    display_rows = rows[:max_rows]
-
-    lines = [f"# {table}", ""]
-
-    # Add row count info
-    lines.append(f"**Rows:** {total_rows}")
-    if total_rows > max_rows:
-        lines.append(f"*(showing first {max_rows} rows)*")
-    lines.append("")
-
-    # Create markdown table
-    if columns and display_rows:
-        # Header
-        lines.append("| " + " | ".join(columns) + " |")
-        lines.append("| " + " | ".join(["---"] * len(columns)) + " |")
-
-        # Rows
-        for row in display_rows:
-            cells = []
-            for cell in row:
-                if isinstance(cell, (bytes, memoryview)):
-                    cells.append(f"[BINARY:{len(cell)}B]")
-                else:
-                    # Escape pipes and truncate long content
-                    cell_str = str(cell).replace("|", "\\|").replace("\n", " ")[:100]
-                    cells.append(cell_str)
-            lines.append("| " + " | ".join(cells) + " |")
+def _binary_columns(description) -> list[int]:
+    """Indices of result columns holding bytea (returned as memoryview)."""
+    return [i for i, desc in enumerate(description) if desc.type_code in psycopg2.BINARY.values]
+
+
+def _mask_binary(rows, binary_columns: list[int]):
+    """
+    Yield rows with binary cells replaced by a [BINARY:n bytes] marker.
+
+    Only the columns picked out by _binary_columns are touched, so tables
+    without bytea columns pass straight through.
+    """
+    if not binary_columns:
+        yield from rows
+        return
+    for row in rows:
+        row = list(row)
+        for i in binary_columns:
+            if row[i] is not None:
+                row[i] = f"[BINARY:{len(row[i])} bytes]"
+        yield row
+
+
+def _write_json_array(f, records) -> None:
+    """
+    Write records to f as a JSON array, one element at a time.
+
+    Produces the same text as json.dump(list(records), f, indent=2,
+    default=str) without ever holding the whole list.
+    """
+    first = True
+    for record in records:
+        f.write("[\n  " if first else ",\n  ")
+        # json.dumps escapes newlines inside strings, so every "\n" here is
+        # indentation and can be shifted one level for the enclosing array
+        f.write(json.dumps(record, indent=2, default=str).replace("\n", "\n  "))
+        first = False
+    f.write("[]" if first else "\n]")
+
+
+def export_to_json(conn, table: str, output_dir: Path, schema: str = "public",
+                   compress: str = "none", json_mode: str = "lines") -> tuple[Path, int]:
+    """
+    Export table to a JSON Lines file, or a JSON array with json_mode="array".
+
+    JSON Lines are rendered by the server with row_to_json and copied out
+    as-is; the array format is built client-side with indent=2.
+    Returns the file and the number of rows written.
+    """
+    output_file = output_dir / f"{table}{JSON_SUFFIXES[json_mode]}{COMPRESS_SUFFIXES[compress]}"
+
+    if json_mode == "lines":
+        # FORMAT text would backslash-escape the JSON. row_to_json escapes
+        # control characters, so with \x01/\x02 as quote and delimiter CSV
+        # mode never quotes and every line is the object itself.
+        cursor = conn.cursor()
+        try:
+            query = _export_query(cursor, table, schema)
+            with _open_output(output_file, compress, text=False) as f:
+                cursor.copy_expert(
+                    f"COPY (SELECT row_to_json(t) FROM ({query}) t) TO STDOUT "
+                    "WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02', ENCODING 'UTF8')", f
+                )
+            rows_written = cursor.rowcount
+        finally:
+            cursor.close()
+        return output_file, rows_written
+
+    cursor, columns, rows = _stream_table(conn, table, schema)
+    rows_written = 0
+
+    def records():
+        nonlocal rows_written
+        for row in _mask_binary(rows, _binary_columns(cursor.description)):
+            rows_written += 1
+            yield dict(zip(columns, row))
+
+    # Rows are serialized as they arrive instead of collected into one list
+    try:
+        with _open_output(output_file, compress) as f:
+            _write_json_array(f, records())
+    finally:
+        cursor.close()
+
+    return output_file, rows_written
+
+
+def _text_value(value) -> str:
+    """Text form of a value stored in a Parquet string column."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str, ensure_ascii=False)
+    return str(value)
+
+
+def export_to_parquet(conn, table: str, output_dir: Path, schema: str = "public") -> tuple[Path, int]:
+    """
+    Export table to a zstd-compressed Parquet file.
+
+    Numbers, booleans, dates and timestamps keep their types; everything
+    else is stored as text, with bytea as a [BINARY:n bytes] marker like the
+    other formats. Rows are written one EXPORT_ITERSIZE record batch at a
+    time. Returns the file and the number of rows written.
+    """
+    output_file = output_dir / f"{table}.parquet"
+
+    cursor, columns, rows = _stream_table(conn, table, schema)
+    rows = _mask_binary(rows, _binary_columns(cursor.description))
+    types = []
+    for desc in cursor.description:
+        factory, *type_args = PARQUET_TYPES.get(desc.type_code, ("string",))
+        types.append(getattr(pa, factory)(*type_args))
+    arrow_schema = pa.schema(list(zip(columns, types)))
+
+    rows_written = 0
+    try:
+        with pq.ParquetWriter(output_file, arrow_schema, compression="zstd") as writer:
+            while batch := list(itertools.islice(rows, EXPORT_ITERSIZE)):
+                arrays = []
+                for values, arrow_type in zip(zip(*batch), types):
+                    if arrow_type == pa.string():
+                        values = [
+                            v if v is None or v.__class__ is str else _text_value(v)
+                            for v in values
+                        ]
+                    arrays.append(pa.array(values, type=arrow_type))
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=arrow_schema))
+                rows_written += len(batch)
+    finally:
+        cursor.close()
+
+    return output_file, rows_written
+
+
+def export_to_markdown(conn, table: str, output_dir: Path, schema: str = "public",
+                       max_rows: int = 100, total_rows: Optional[int] = None) -> tuple[Path, int]:
+    """
+    Export table to Markdown file with table format. Returns the file and row count.
+
+    When total_rows is already known, e.g. from another format's export of
+    the same table, only the displayed rows are read.
+    """
+    output_file = output_dir / f"{table}.md"
+
+    if total_rows is not None:
+        cursor, columns, rows = _stream_table(conn, table, schema, limit=max_rows)
+        try:
+            display_rows = list(rows)
+        finally:
+            cursor.close()
     else:
-        lines.append("*Empty table*")
+        # Keep only the rows that get displayed; the rest are counted as
+        # they stream past rather than held in memory
+        cursor, columns, rows = _stream_table(conn, table, schema)
+        display_rows = []
+        total_rows = 0
+        try:
+            for row in rows:
+                if total_rows < max_rows:
+                    display_rows.append(row)
+                total_rows += 1
+        finally:
+            cursor.close()
+
+    # Lines go straight to the file; the last one has no trailing newline
+    with _open_output(output_file) as f:
+        w = f.write
+        w(f"# {table}\n\n")
+
+        # Add row count info
+        w(f"**Rows:** {total_rows}\n")
+        if total_rows > max_rows:
+            w(f"*(showing first {max_rows} rows)*\n")
+        w("\n")
+
+        # Create markdown table
+        if columns and display_rows:
+            # Header
+            w("| " + " | ".join(columns) + " |\n")
+            w("| " + " | ".join(["---"] * len(columns)) + " |")
+
+            # Rows
+            for row in display_rows:
+                cells = []
+                for cell in row:
+                    if isinstance(cell, (bytes, memoryview)):
+                        cells.append(f"[BINARY:{len(cell)}B]")
+                    else:
+                        # Escape pipes and truncate long content
+                        cell_str = str(cell).replace("|", "\\|").replace("\n", " ")[:100]
+                        cells.append(cell_str)
+                w("\n| " + " | ".join(cells) + " |")
+        else:
+            w("*Empty table*")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+    return output_file, total_rows
 
-    return output_file
 
+def export_schema_info(conn, tables: list[str], output_dir: Path, schema: str = "public",
+                       row_counts: Optional[dict[str, int]] = None) -> Path:
+    """
+    Export database schema as Markdown documentation.
 
-def export_schema_info(conn, tables: list[str], output_dir: Path, schema: str = "public") -> Path:
-    """Export database schema as Markdown documentation."""
+    row_counts, e.g. as reported by the exporters, saves counting every table
+    again; without it the counts are queried.
+    """
     output_file = output_dir / "_schema.md"
 
     # Get database name
@@ -288,31 +603,35 @@ def export_schema_info(conn, tables: list[str], output_dir: Path, schema: str =
     db_name = cursor.fetchone()[0]
     cursor.close()
 
-    lines = [f"# Database Schema: {db_name}", f"**Schema:** {schema}", ""]
-
-    for table in tables:
-        table_schema = get_schema(conn, table, schema)
-        row_count = get_row_count(conn, table, schema)
-        table_info = get_table_info(conn, table, schema)
-
-        lines.append(f"## {table}")
-        lines.append(f"**Rows:** {row_count}")
-        if table_info.get("size"):
-            lines.append(f"**Size:** {table_info['size']}")
-        lines.append("")
-        lines.append("| Column | Type | Nullable | Primary Key | Auto-Inc |")
-        lines.append("| --- | --- | --- | --- | --- |")
-
-        for col in table_schema:
-            pk = "Yes" if col["primary_key"] else ""
-            nullable = "Yes" if col["nullable"] else ""
-            auto_inc = "Yes" if col["auto_increment"] else ""
-            lines.append(f"| {col['name']} | {col['type']} | {nullable} | {pk} | {auto_inc} |")
+    # Metadata for every table comes from a handful of batched queries
+    schemas = get_schemas(conn, tables, schema)
+    if row_counts is None:
+        row_counts = get_row_counts(conn, tables, schema)
+    table_infos = get_table_infos(conn, tables, schema)
 
-        lines.append("")
+    # Each table's section starts with the blank line that ends the previous one
+    with _open_output(output_file) as f:
+        w = f.write
+        w(f"# Database Schema: {db_name}\n**Schema:** {schema}\n")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        for table in tables:
+            table_schema = schemas[table]
+            row_count = row_counts[table]
+            table_info = table_infos.get(table, {})
+
+            w(f"\n## {table}\n")
+            w(f"**Rows:** {row_count}\n")
+            if table_info.get("size"):
+                w(f"**Size:** {table_info['size']}\n")
+            w("\n")
+            w("| Column | Type | Nullable | Primary Key | Auto-Inc |\n")
+            w("| --- | --- | --- | --- | --- |\n")
+
+            for col in table_schema:
+                pk = "Yes" if col["primary_key"] else ""
+                nullable = "Yes" if col["nullable"] else ""
+                auto_inc = "Yes" if col["auto_increment"] else ""
+                w(f"| {col['name']} | {col['type']} | {nullable} | {pk} | {auto_inc} |\n")
 
     return output_file
 
@@ -348,9 +667,9 @@ Examples:
     parser.add_argument("-o", "--output",
                         help="Output directory (default: same directory as script invocation)")
     parser.add_argument("-f", "--format",
-                        choices=["csv", "json", "markdown", "all"],
+                        choices=["csv", "json", "markdown", "parquet", "all"],
                         default="csv",
-                        help="Output format (default: csv)")
+                        help="Output format; all = csv, json and markdown (default: csv)")
     parser.add_argument("--tables",
                         help="Comma-separated list of tables (default: all)")
     parser.add_argument("--exclude",
@@ -363,11 +682,29 @@ Examples:
                         help="Max rows for markdown format (default: 100)")
     parser.add_argument("--timeout", type=int, default=30,
                         help="Connection timeout in seconds (default: 30)")
+    parser.add_argument("--query-timeout", type=int, default=0,
+                        help="Per-statement timeout in seconds, 0 = none (default: 0)")
+    parser.add_argument("--json-mode", choices=list(JSON_SUFFIXES), default="lines",
+                        help="JSON Lines (.jsonl) or a single JSON array (.json) (default: lines)")
+    parser.add_argument("--compress", choices=list(COMPRESS_SUFFIXES), default="none",
+                        help="Compress CSV/JSON output (default: none)")
+    parser.add_argument("-w", "--workers", type=int, default=8,
+                        help="Tables exported in parallel, one connection each (default: 8)")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
 
     args = parser.parse_args()
 
+    if args.format == "parquet" and pa is None:
+        print("ERROR: -f parquet requires pyarrow.", file=sys.stderr)
+        print("Install with: pip install pyarrow", file=sys.stderr)
+        sys.exit(1)
+
+    if args.compress == "zstd" and zstandard is None:
+        print("ERROR: --compress zstd requires zstandard.", file=sys.stderr)
+        print("Install with: pip install zstandard", file=sys.stderr)
+        sys.exit(1)
+
     def log(msg):
         if not args.quiet:
             print(msg)
@@ -376,7 +713,8 @@ Examples:
         # Connect to database
         masked_conn = args.connection.split('@')[0].split(':')[0] + "://***@" + args.connection.split('@')[-1]
         log(f"Connecting: {masked_conn}")
-        conn = get_connection(args.connection, timeout=args.timeout)
+        conn = get_connection(args.connection, timeout=args.timeout,
+                              query_timeout=args.query_timeout)
 
         # Get tables
         all_tables = get_tables(conn, args.db_schema)
@@ -404,28 +742,56 @@ Examples:
         # Determine formats to export
         formats = ["csv", "json", "markdown"] if args.format == "all" else [args.format]
 
-        # Export each table
-        for table in tables:
-            row_count = get_row_count(conn, table, args.db_schema)
-            log(f"  {table} ({row_count} rows)")
-
+        subdirs = {}
+        for fmt in formats:
+            subdirs[fmt] = output_dir / fmt if len(formats) > 1 else output_dir
+            subdirs[fmt].mkdir(exist_ok=True)
+
+        # Tables are independent, so export them concurrently. Connections
+        # are not thread-safe: each worker opens its own on first use.
+        worker_local = threading.local()
+        worker_conns = []
+        row_counts = {}
+
+        def export_table(table):
+            wconn = getattr(worker_local, "conn", None)
+            if wconn is None:
+                wconn = worker_local.conn = get_connection(
+                    args.connection, timeout=args.timeout, query_timeout=args.query_timeout
+                )
+                worker_conns.append(wconn)
+
+            # Every exporter reads the whole table, so the row count comes
+            # with the export instead of from a separate COUNT(*)
+            row_count = None
             for fmt in formats:
                 if fmt == "csv":
-                    subdir = output_dir / "csv" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_csv(conn, table, subdir, args.db_schema)
+                    _, row_count = export_to_csv(wconn, table, subdirs[fmt], args.db_schema,
+                                                 args.compress)
                 elif fmt == "json":
-                    subdir = output_dir / "json" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_json(conn, table, subdir, args.db_schema)
+                    _, row_count = export_to_json(wconn, table, subdirs[fmt], args.db_schema,
+                                                  args.compress, args.json_mode)
                 elif fmt == "markdown":
-                    subdir = output_dir / "markdown" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_markdown(conn, table, subdir, args.db_schema, args.max_rows)
+                    # With -f all the count is known by now, so only the
+                    # displayed rows are fetched
+                    _, row_count = export_to_markdown(wconn, table, subdirs[fmt], args.db_schema,
+                                                      args.max_rows, row_count)
+                elif fmt == "parquet":
+                    _, row_count = export_to_parquet(wconn, table, subdirs[fmt], args.db_schema)
+            return table, row_count
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(args.workers, len(tables)))) as executor:
+                for table, row_count in executor.map(export_table, tables):
+                    row_counts[table] = row_count
+                    log(f"  {table} ({row_count} rows)")
+        finally:
+            for wconn in worker_conns:
+                wconn.close()
 
         # Export schema if requested
         if args.schema:
-            schema_file = export_schema_info(conn, tables, output_dir, args.db_schema)
+            schema_file = export_schema_info(conn, tables, output_dir, args.db_schema, row_counts)
             log(f"  Schema -> {schema_file}")
 
         conn.close()
@@ -19,14 +19,58 @@ Usage:
 import argparse
 import csv
 import json
+import os
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # Optional: faster JSON Lines serialization
+except ImportError:
+    orjson = None
 
-def get_connection(db_path: str):
-    """Create database connection. Supports SQLite and basic URI formats."""
+try:
+    import apsw  # Optional: thinner SQLite binding, used with --apsw
+    import apsw.ext
+except ImportError:
+    apsw = None
+
+# Errors reported as DATABASE ERROR, from whichever binding is in use
+DB_ERRORS = (sqlite3.Error, apsw.Error) if apsw is not None else (sqlite3.Error,)
+
+# Read tuning applied to every connection: map up to 256 MB of the file so
+# page reads skip the read() copy, a 64 MB page cache, in-memory temp storage
+READ_PRAGMAS = (
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# JSON export file extension for each --json-mode
+JSON_SUFFIXES = {"lines": ".jsonl", "array": ".json"}
+
+# Rows fetched per batch while streaming a table
+FETCH_BATCH_SIZE = 10000
+
+# Write buffer for CSV and JSON output files; rows arrive in large batches,
+# so few, large write() calls beat the 8 KB default
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# JSON Lines encoded and joined per write() call
+JSON_WRITE_BATCH = 1024
+
+
+def get_connection(db_path: str, use_apsw: bool = False):
+    """
+    Create database connection. Supports SQLite and basic URI formats.
+    
+    The file is opened read-only, which is also what makes memory-mapped
+    I/O safe here: nothing is ever written through the mapping. use_apsw
+    opens it through apsw instead of the sqlite3 module.
+    """
     path = Path(db_path)
     
     # Handle SQLite URI format
@@ -37,11 +81,48 @@ def get_connection(db_path: str):
     if not path.exists():
         raise FileNotFoundError(f"Database not found: {path}")
     
-    conn = sqlite3.connect(str(path))
-    conn.row_factory = sqlite3.Row
+    uri = f"{path.resolve().as_uri()}?mode=ro"
+    if use_apsw:
+        conn = apsw.Connection(uri, flags=apsw.SQLITE_OPEN_READONLY | apsw.SQLITE_OPEN_URI)
+    else:
+        conn = sqlite3.connect(uri, uri=True)
+    for pragma in READ_PRAGMAS:
+        conn.execute(pragma)
+    # Rows stay plain tuples: every reader here indexes by position or zips
+    # with cursor.description, so sqlite3.Row objects would be pure overhead
     return conn
 
 
+def _quote_name(name: str) -> str:
+    """Quote an identifier for SQL: "name", with embedded quotes doubled."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _execute(conn, sql: str, params: tuple = ()) -> tuple:
+    """Run a query; returns its cursor and column names (sqlite3 or apsw)."""
+    cursor = conn.execute(sql, params)
+    if isinstance(conn, sqlite3.Connection):
+        description = cursor.description
+    else:
+        # apsw only describes a statement that is still running, so a result
+        # that is already exhausted (an empty table) is described separately
+        try:
+            description = cursor.description
+        except apsw.ExecutionCompleteError:
+            description = apsw.ext.query_info(conn, sql, params).description
+    return cursor, [desc[0] for desc in description]
+
+
+def _stream_table(conn, table: str) -> tuple:
+    """Cursor and column names for every row of table."""
+    return _execute(conn, f"SELECT * FROM {_quote_name(table)}")
+
+
+def _fetch_batches(cursor):
+    """Yield lists of up to FETCH_BATCH_SIZE rows (apsw cursors lack fetchmany)."""
+    return iter(lambda: list(islice(cursor, FETCH_BATCH_SIZE)), [])
+
+
 def get_tables(conn) -> list[str]:
     """Get list of all tables in database."""
     cursor = conn.execute(
@@ -52,7 +133,7 @@ def get_tables(conn) -> list[str]:
 
 def get_schema(conn, table: str) -> list[dict]:
     """Get column info for a table."""
-    cursor = conn.execute(f"PRAGMA table_info('{table}')")
+    cursor = conn.execute(f"PRAGMA table_info({_quote_name(table)})")
     return [
         {
             "name": row[1],
@@ -66,52 +147,144 @@ def get_schema(conn, table: str) -> list[dict]:
 
 def get_row_count(conn, table: str) -> int:
     """Get row count for a table."""
-    cursor = conn.execute(f"SELECT COUNT(*) FROM '{table}'")
+    cursor = conn.execute(f"SELECT COUNT(*) FROM {_quote_name(table)}")
     return cursor.fetchone()[0]
 
 
+def describe_table(conn, table: str) -> dict:
+    """
+    Column info and row count for a table, queried once and shared by the
+    progress log, the Markdown export and the schema documentation.
+    """
+    return {
+        "schema": get_schema(conn, table),
+        "row_count": get_row_count(conn, table),
+    }
+
+
 def export_to_csv(conn, table: str, output_dir: Path) -> Path:
     """Export table to CSV file."""
     output_file = output_dir / f"{table}.csv"
     
-    cursor = conn.execute(f"SELECT * FROM '{table}'")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
+    # Rows stream from SQLite in batches instead of being loaded at once
+    cursor, columns = _stream_table(conn, table)
     
-    with open(output_file, "w", newline="", encoding="utf-8") as f:
+    with open(output_file, "w", newline="", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(columns)
-        writer.writerows(rows)
+        for batch in _fetch_batches(cursor):
+            writer.writerows(batch)
     
     return output_file
 
 
-def export_to_json(conn, table: str, output_dir: Path) -> Path:
-    """Export table to JSON file."""
-    output_file = output_dir / f"{table}.json"
+def _write_json_array(f, records) -> None:
+    """
+    Write records to f as a JSON array, one element at a time.
     
-    cursor = conn.execute(f"SELECT * FROM '{table}'")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
+    Produces the same text as json.dump(list(records), f, indent=2,
+    default=str) without ever holding the whole list.
+    """
+    first = True
+    for record in records:
+        f.write("[\n  " if first else ",\n  ")
+        # json.dumps escapes newlines inside strings, so every "\n" here is
+        # indentation and can be shifted one level for the enclosing array
+        f.write(json.dumps(record, indent=2, default=str).replace("\n", "\n  "))
+        first = False
+    f.write("[]" if first else "\n]")
+
+
+def _write_json_lines(f, records) -> None:
+    """
+    Write records to the binary stream f as JSON Lines, one object per line.
     
-    data = [dict(zip(columns, row)) for row in rows]
+    orjson is used when installed, the json module otherwise; BLOBs go
+    through default=str either way. Lines are joined JSON_WRITE_BATCH at a
+    time so f.write() runs once per batch rather than once per row.
+    """
+    if orjson is not None:
+        def encode(record):
+            return orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        def encode(record):
+            line = json.dumps(record, default=str, ensure_ascii=False, separators=(",", ":"))
+            return line.encode("utf-8") + b"\n"
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+    records = iter(records)
+    for batch in iter(lambda: list(islice(records, JSON_WRITE_BATCH)), []):
+        f.write(b"".join([encode(record) for record in batch]))
+
+
+def export_to_json(conn, table: str, output_dir: Path, json_mode: str = "lines") -> Path:
+    """Export table to a JSON Lines file, or a JSON array with json_mode="array"."""
+    output_file = output_dir / f"{table}{JSON_SUFFIXES[json_mode]}"
+    
+    cursor, columns = _stream_table(conn, table)
+    
+    def records():
+        for batch in _fetch_batches(cursor):
+            for row in batch:
+                yield dict(zip(columns, row))
+    
+    _write_json_file(output_file, records(), json_mode)
     
     return output_file
 
 
-def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100) -> Path:
-    """Export table to Markdown file with table format."""
-    output_file = output_dir / f"{table}.md"
+def _write_json_file(output_file: Path, records, json_mode: str) -> None:
+    """Write records to output_file as JSON Lines or a JSON array."""
+    # Rows are serialized as they arrive instead of collected into one list
+    if json_mode == "lines":
+        with open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            _write_json_lines(f, records)
+    else:
+        with open(output_file, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+            _write_json_array(f, records)
+
+
+def export_to_csv_and_json(conn, table: str, csv_dir: Path, json_dir: Path,
+                           json_mode: str = "lines") -> tuple[Path, Path]:
+    """
+    Export table to CSV and JSON from a single scan.
     
-    cursor = conn.execute(f"SELECT * FROM '{table}'")
-    columns = [desc[0] for desc in cursor.description]
-    rows = cursor.fetchall()
+    Each fetched batch goes to the CSV writer before its rows are handed to
+    the JSON writer, so the table is read once for both files.
+    """
+    csv_file = csv_dir / f"{table}.csv"
+    json_file = json_dir / f"{table}{JSON_SUFFIXES[json_mode]}"
     
-    total_rows = len(rows)
-    display_rows = rows[:max_rows]
+    cursor, columns = _stream_table(conn, table)
+    
+    with open(csv_file, "w", newline="", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        
+        def records():
+            for batch in _fetch_batches(cursor):
+                writer.writerows(batch)
+                for row in batch:
+                    yield dict(zip(columns, row))
+        
+        _write_json_file(json_file, records(), json_mode)
+    
+    return csv_file, json_file
+
+
+def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100,
+                       total_rows: Optional[int] = None) -> Path:
+    """
+    Export table to Markdown file with table format.
+    
+    total_rows, when already known from describe_table, saves a COUNT(*).
+    """
+    output_file = output_dir / f"{table}.md"
+    
+    # Only the displayed rows are read
+    cursor, columns = _execute(conn, f"SELECT * FROM {_quote_name(table)} LIMIT ?", (max_rows,))
+    display_rows = cursor.fetchall()
+    if total_rows is None:
+        total_rows = get_row_count(conn, table)
     
     lines = [f"# {table}", ""]
     
@@ -129,7 +302,9 @@ def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100)
         
         # Rows
         for row in display_rows:
-            cells = [str(cell).replace("|", "\\|").replace("\n", " ")[:100] for cell in row]
+            # Escaping never shortens text, so only the first 100 characters
+            # can reach the output: cut before escaping, not after
+            cells = [str(cell)[:100].replace("|", "\\|").replace("\n", " ")[:100] for cell in row]
             lines.append("| " + " | ".join(cells) + " |")
     else:
         lines.append("*Empty table*")
@@ -140,15 +315,23 @@ def export_to_markdown(conn, table: str, output_dir: Path, max_rows: int = 100)
     return output_file
 
 
-def export_schema_info(conn, tables: list[str], output_dir: Path) -> Path:
-    """Export database schema as Markdown documentation."""
+def export_schema_info(conn, tables: list[str], output_dir: Path,
+                       descriptions: Optional[dict[str, dict]] = None) -> Path:
+    """
+    Export database schema as Markdown documentation.
+    
+    descriptions maps tables to their describe_table result; missing ones
+    are queried here.
+    """
     output_file = output_dir / "_schema.md"
+    descriptions = descriptions or {}
     
     lines = ["# Database Schema", ""]
     
     for table in tables:
-        schema = get_schema(conn, table)
-        row_count = get_row_count(conn, table)
+        description = descriptions.get(table) or describe_table(conn, table)
+        schema = description["schema"]
+        row_count = description["row_count"]
         
         lines.append(f"## {table}")
         lines.append(f"**Rows:** {row_count}")
@@ -169,6 +352,23 @@ def export_schema_info(conn, tables: list[str], output_dir: Path) -> Path:
     return output_file
 
 
+def _export_table(db_path: str, table: str, fmt: str, subdirs: dict[str, Path],
+                  max_rows: int, json_mode: str, row_count: int, use_apsw: bool) -> None:
+    """Export one table to one format on its own connection (ProcessPoolExecutor worker)."""
+    conn = get_connection(db_path, use_apsw)
+    try:
+        if fmt == "csv":
+            export_to_csv(conn, table, subdirs["csv"])
+        elif fmt == "json":
+            export_to_json(conn, table, subdirs["json"], json_mode)
+        elif fmt == "csv+json":
+            export_to_csv_and_json(conn, table, subdirs["csv"], subdirs["json"], json_mode)
+        elif fmt == "markdown":
+            export_to_markdown(conn, table, subdirs["markdown"], max_rows, row_count)
+    finally:
+        conn.close()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract database content to text-readable formats",
@@ -210,6 +410,12 @@ Examples:
                         help="Also export schema documentation")
     parser.add_argument("--max-rows", type=int, default=100,
                         help="Max rows for markdown format (default: 100)")
+    parser.add_argument("--json-mode", choices=list(JSON_SUFFIXES), default="lines",
+                        help="JSON Lines (.jsonl) or a single JSON array (.json) (default: lines)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Table exports run in parallel processes (default: CPU count)")
+    parser.add_argument("--apsw", action="store_true",
+                        help="Read through apsw instead of the sqlite3 module (faster scans)")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
     
@@ -219,10 +425,15 @@ Examples:
         if not args.quiet:
             print(msg)
     
+    if args.apsw and apsw is None:
+        print("ERROR: --apsw requires apsw.", file=sys.stderr)
+        print("Install with: pip install apsw", file=sys.stderr)
+        sys.exit(1)
+    
     try:
         # Connect to database
         log(f"Opening: {args.database}")
-        conn = get_connection(args.database)
+        conn = get_connection(args.database, args.apsw)
         
         # Get tables
         all_tables = get_tables(conn)
@@ -253,28 +464,44 @@ Examples:
         # Determine formats to export
         formats = ["csv", "json", "markdown"] if args.format == "all" else [args.format]
         
-        # Export each table
-        for table in tables:
-            row_count = get_row_count(conn, table)
-            log(f"  {table} ({row_count} rows)")
-            
-            for fmt in formats:
-                if fmt == "csv":
-                    subdir = output_dir / "csv" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_csv(conn, table, subdir)
-                elif fmt == "json":
-                    subdir = output_dir / "json" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_json(conn, table, subdir)
-                elif fmt == "markdown":
-                    subdir = output_dir / "markdown" if len(formats) > 1 else output_dir
-                    subdir.mkdir(exist_ok=True)
-                    export_to_markdown(conn, table, subdir, args.max_rows)
+        subdirs = {}
+        for fmt in formats:
+            subdirs[fmt] = output_dir / fmt if len(formats) > 1 else output_dir
+            subdirs[fmt].mkdir(exist_ok=True)
+        
+        # Every (table, format) export is independent; SQLite allows any
+        # number of read-only connections, so each worker process opens its own
+        descriptions = {table: describe_table(conn, table) for table in tables}
+        
+        # CSV and JSON together share one scan; Markdown reads only
+        # max_rows rows and stays a separate job
+        job_formats = formats
+        if "csv" in formats and "json" in formats:
+            job_formats = ["csv+json"] + [fmt for fmt in formats if fmt not in ("csv", "json")]
+        # Empty tables are known from their row count and produce no files
+        jobs = [(table, fmt) for table in tables for fmt in job_formats
+                if descriptions[table]["row_count"]]
+        workers = max(1, min(args.workers, len(jobs)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                (table, fmt): executor.submit(
+                    _export_table, args.database, table, fmt, subdirs,
+                    args.max_rows, args.json_mode, descriptions[table]["row_count"],
+                    args.apsw,
+                )
+                for table, fmt in jobs
+            }
+            for table in tables:
+                if not descriptions[table]["row_count"]:
+                    log(f"  {table} (skipped - empty)")
+                    continue
+                for fmt in job_formats:
+                    futures[(table, fmt)].result()
+                log(f"  {table} ({descriptions[table]['row_count']} rows)")
         
         # Export schema if requested
         if args.schema:
-            schema_file = export_schema_info(conn, tables, output_dir)
+            schema_file = export_schema_info(conn, tables, output_dir, descriptions)
             log(f"  Schema -> {schema_file}")
         
         conn.close()
@@ -283,7 +510,7 @@ Examples:
     except FileNotFoundError as e:
         print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(1)
-    except sqlite3.Error as e:
+    except DB_ERRORS as e:
         print(f"DATABASE ERROR: {e}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
@@ -13,8 +13,12 @@ Usage:
 """
 
 import argparse
+import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -24,6 +28,14 @@ except ImportError:
     print("ERROR: pandas is required. Install with: pip install pandas openpyxl", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import python_calamine  # Optional: Rust reader, much faster than openpyxl
+except ImportError:
+    python_calamine = None
+
+# pandas reads through calamine when it is installed, openpyxl otherwise
+EXCEL_ENGINE = "calamine" if python_calamine is not None else "openpyxl"
+
 
 def sanitize_filename(name: str) -> str:
     """Sanitize sheet name for use as filename."""
@@ -35,10 +47,9 @@ def sanitize_filename(name: str) -> str:
     return sanitized[:100] if sanitized else "unnamed_sheet"
 
 
-def get_sheet_names(file_path: Path) -> list[str]:
-    """Get list of all sheet names in workbook."""
-    xlsx = pd.ExcelFile(file_path)
-    return xlsx.sheet_names
+def open_workbook(file_path: Path) -> pd.ExcelFile:
+    """Open the workbook once; its sheet names and every sheet parse share it."""
+    return pd.ExcelFile(file_path, engine=EXCEL_ENGINE)
 
 
 def is_sheet_empty(df: pd.DataFrame) -> bool:
@@ -49,12 +60,9 @@ def is_sheet_empty(df: pd.DataFrame) -> bool:
     return df.dropna(how='all').dropna(axis=1, how='all').empty
 
 
-def export_sheet_to_csv(file_path: Path, sheet_name: str, output_dir: Path) -> Optional[Path]:
-    """Export a single sheet to CSV file."""
+def export_df_to_csv(df: pd.DataFrame, sheet_name: str, output_dir: Path) -> Optional[Path]:
+    """Export an already-loaded sheet to CSV file."""
     try:
-        # Read sheet with data_only equivalent (pandas reads values, not formulas)
-        df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
-
         # Clean up: drop completely empty rows and columns
         df = df.dropna(how='all').dropna(axis=1, how='all')
 
@@ -74,6 +82,23 @@ def export_sheet_to_csv(file_path: Path, sheet_name: str, output_dir: Path) -> O
         return None
 
 
+def export_sheet(workbook: pd.ExcelFile, sheet_name: str, output_dir: Path,
+                 skip_empty: bool) -> tuple[str, Optional[Path], float]:
+    """Parse and export one sheet; returns (status, output_file, seconds)."""
+    start = time.perf_counter()
+    try:
+        df = workbook.parse(sheet_name)
+    except Exception as e:
+        print(f"  WARNING: Failed to export sheet '{sheet_name}': {e}", file=sys.stderr)
+        return "error", None, time.perf_counter() - start
+
+    if skip_empty and is_sheet_empty(df):
+        return "empty", None, time.perf_counter() - start
+
+    output_file = export_df_to_csv(df, sheet_name, output_dir)
+    return ("exported" if output_file else "error"), output_file, time.perf_counter() - start
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract Excel spreadsheet sheets to CSV format",
@@ -103,6 +128,8 @@ Examples:
                         help="Comma-separated list of sheets to exclude")
     parser.add_argument("--skip-empty", action="store_true",
                         help="Skip sheets with no data")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Sheets exported in parallel (default: CPU count)")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
 
@@ -121,8 +148,10 @@ Examples:
 
         log(f"Opening: {file_path}")
 
-        # Get all sheet names
-        all_sheets = get_sheet_names(file_path)
+        # Open the archive once (ZIP directory and shared strings are read a
+        # single time) and parse only the sheets that are selected
+        workbook = open_workbook(file_path)
+        all_sheets = workbook.sheet_names
 
         if args.sheets:
             sheets = [s.strip() for s in args.sheets.split(",")]
@@ -151,24 +180,43 @@ Examples:
         exported = 0
         skipped = 0
 
-        for sheet_name in sheets:
-            # Check if empty before exporting (if skip-empty flag set)
-            if args.skip_empty:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
-                if is_sheet_empty(df):
-                    log(f"  {sheet_name} (skipped - empty)")
-                    skipped += 1
-                    continue
-
-            output_file = export_sheet_to_csv(file_path, sheet_name, output_dir)
-
-            if output_file:
-                log(f"  {sheet_name} -> {output_file.name}")
+        workers = max(1, min(args.workers, len(sheets)))
+        if workers == 1:
+            results = (export_sheet(workbook, sheet_name, output_dir, args.skip_empty)
+                       for sheet_name in sheets)
+            executor = None
+        else:
+            # Workbook handles are not thread-safe: each worker opens its own once
+            local = threading.local()
+            thread_workbooks = []
+
+            def export_in_thread(sheet_name):
+                if not hasattr(local, "workbook"):
+                    local.workbook = open_workbook(file_path)
+                    thread_workbooks.append(local.workbook)
+                return export_sheet(local.workbook, sheet_name, output_dir, args.skip_empty)
+
+            executor = ThreadPoolExecutor(max_workers=workers)
+            results = executor.map(export_in_thread, sheets)
+
+        # Results arrive in sheet order; per-sheet timings show which sheet dominates
+        for sheet_name, (status, output_file, seconds) in zip(sheets, results):
+            if status == "empty":
+                log(f"  {sheet_name} (skipped - empty)")
+                skipped += 1
+            elif output_file:
+                log(f"  {sheet_name} -> {output_file.name} ({seconds:.2f}s)")
                 exported += 1
             else:
                 log(f"  {sheet_name} (skipped - empty or error)")
                 skipped += 1
 
+        if executor is not None:
+            executor.shutdown()
+            for thread_workbook in thread_workbooks:
+                thread_workbook.close()
+        workbook.close()
+
         log(f"\nExtracted {exported} sheets to: {output_dir}")
         if skipped:
             log(f"Skipped {skipped} sheets (empty or errors)")
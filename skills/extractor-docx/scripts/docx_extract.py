@@ -14,51 +14,81 @@ Usage:
 """
 
 import argparse
+import hashlib
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 
 def check_pandoc() -> bool:
-    """Check if pandoc is available."""
-    try:
-        subprocess.run(["pandoc", "--version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if pandoc is available (a PATH lookup, no process is started)."""
+    return shutil.which("pandoc") is not None
 
 
-def extract_to_markdown(docx_path: Path, output_path: Path, track_changes: bool = False) -> Path:
-    """Extract docx content to markdown using pandoc."""
-    cmd = ["pandoc", "-f", "docx", "-t", "markdown"]
+def file_digest(path: Path) -> bytes:
+    """SHA-256 of a file's content, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def output_path_for(docx_path: Path, output_dir: Path, fmt: str) -> Path:
+    """Output file for a document: its stem with the format's extension."""
+    ext = ".md" if fmt == "md" else ".txt"
+    return output_dir / f"{docx_path.stem}{ext}"
+
+
+def copy_output(source: Path, output_path: Path) -> Optional[Path]:
+    """Place a rendered output (shared by documents with the same content)."""
+    try:
+        shutil.copyfile(source, output_path)
+        return output_path
+    except OSError as e:
+        print(f"  WARNING: Failed to write '{output_path.name}': {e}", file=sys.stderr)
+        return None
+
 
-    if track_changes:
-        cmd.extend(["--track-changes=all"])
+def pandoc_command(fmt: str, track_changes: bool = False) -> tuple[str, ...]:
+    """pandoc arguments shared by every document of a run (all but input and output)."""
+    if fmt == "md":
+        return ("pandoc", "-f", "docx", "-t", "markdown",
+                *(["--track-changes=all"] if track_changes else []))
+    return ("pandoc", "-f", "docx", "-t", "plain")
 
-    cmd.extend([str(docx_path), "-o", str(output_path)])
 
-    subprocess.run(cmd, check=True, capture_output=True)
+def run_pandoc(base_cmd: tuple[str, ...], docx_path: Path, output_path: Path) -> Path:
+    """Convert one document with a prebuilt pandoc command."""
+    subprocess.run([*base_cmd, str(docx_path), "-o", str(output_path)], check=True, capture_output=True)
     return output_path
 
 
+def extract_to_markdown(docx_path: Path, output_path: Path, track_changes: bool = False) -> Path:
+    """Extract docx content to markdown using pandoc."""
+    return run_pandoc(pandoc_command("md", track_changes), docx_path, output_path)
+
+
 def extract_to_text(docx_path: Path, output_path: Path) -> Path:
     """Extract docx content to plain text using pandoc."""
-    cmd = ["pandoc", "-f", "docx", "-t", "plain", str(docx_path), "-o", str(output_path)]
-    subprocess.run(cmd, check=True, capture_output=True)
-    return output_path
+    return run_pandoc(pandoc_command("txt"), docx_path, output_path)
 
 
-def process_file(docx_path: Path, output_dir: Path, fmt: str, track_changes: bool) -> Optional[Path]:
-    """Process a single docx file."""
+def process_file(docx_path: Path, output_dir: Path, fmt: str, track_changes: bool,
+                 base_cmd: Optional[tuple[str, ...]] = None,
+                 output_path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Process a single docx file (base_cmd: pandoc_command() built once per batch;
+    output_path: write there instead of the document's path in output_dir).
+    """
     try:
-        ext = ".md" if fmt == "md" else ".txt"
-        output_path = output_dir / f"{docx_path.stem}{ext}"
-
-        if fmt == "md":
-            return extract_to_markdown(docx_path, output_path, track_changes)
-        else:
-            return extract_to_text(docx_path, output_path)
+        output_path = output_path or output_path_for(docx_path, output_dir, fmt)
+        return run_pandoc(base_cmd or pandoc_command(fmt, track_changes), docx_path, output_path)
     except subprocess.CalledProcessError as e:
         print(f"  WARNING: Failed to extract '{docx_path.name}': {e}", file=sys.stderr)
         return None
@@ -100,6 +130,8 @@ Examples:
                         help="Recursive directory scan")
     parser.add_argument("--track-changes", action="store_true",
                         help="Include tracked changes in output")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Documents converted in parallel (default: CPU count)")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
 
@@ -138,13 +170,62 @@ Examples:
         exported = 0
         failed = 0
 
+        # Identical documents (copies, mirrored downloads) are converted once.
+        # Each distinct content is rendered into a private scratch file, and
+        # outputs are then placed from it in file order, so documents sharing
+        # an output name (same stem in different folders with -r) resolve the
+        # same way as a serial run: the last one wins
+        original_of = {}
+        first_by_digest = {}
         for docx_path in docx_files:
-            result = process_file(docx_path, output_dir, args.format, args.track_changes)
-            if result:
-                log(f"  {docx_path.name} -> {result.name}")
-                exported += 1
-            else:
-                failed += 1
+            try:
+                digest = file_digest(docx_path)
+            except OSError:
+                original_of[docx_path] = docx_path  # process_file reports it
+                continue
+            original_of[docx_path] = first_by_digest.setdefault(digest, docx_path)
+        unique_files = [docx_path for docx_path in docx_files if original_of[docx_path] is docx_path]
+
+        # Documents sharing an output name overwrite each other, as in a
+        # serial run; say which one is kept
+        sources_of = {}
+        for docx_path in docx_files:
+            sources_of.setdefault(output_path_for(docx_path, output_dir, args.format), []).append(docx_path)
+        for output_path, sources in sources_of.items():
+            if len(sources) > 1:
+                print(f"  WARNING: {len(sources)} documents map to '{output_path.name}'; "
+                      f"keeping '{sources[-1]}'", file=sys.stderr)
+
+        # Each conversion waits on its own pandoc process, so threads are enough
+        # to keep several running; results are logged in file order
+        workers = max(1, min(args.workers, len(unique_files)))
+        base_cmd = pandoc_command(args.format, args.track_changes)
+        with tempfile.TemporaryDirectory(prefix=".docx_extract-", dir=output_dir) as scratch_dir, \
+                ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda item: process_file(item[1], output_dir, args.format, args.track_changes,
+                                          base_cmd,
+                                          output_path_for(Path(str(item[0])), Path(scratch_dir), args.format)),
+                enumerate(unique_files),
+            )
+            # A duplicate always comes after its original, whose result is known by then
+            rendered = {}
+            for docx_path in docx_files:
+                original = original_of[docx_path]
+                if original is docx_path:
+                    rendered[docx_path] = next(results)
+                source = rendered[original]
+                result = None
+                if source:
+                    result = copy_output(source, output_path_for(docx_path, output_dir, args.format))
+                if result:
+                    if original is docx_path:
+                        log(f"  {docx_path.name} -> {result.name}")
+                    else:
+                        log(f"  {docx_path.name} -> {result.name} (same content as {original.name})")
+                    exported += 1
+                else:
+                    failed += 1
 
         log(f"\nExtracted {exported} documents to: {output_dir}")
         if failed:
@@ -12,51 +12,105 @@ Options:
     --format FMT        Output format: markdown, gfm, commonmark (default: markdown)
     --exclude PATTERN   Glob pattern to exclude (can be used multiple times)
     --strip-elements    Strip script, style, nav, footer, header before conversion
+    --fast-strip        Strip with a regex instead of an HTML parser (trusted HTML)
 """
 
 import argparse
+import hashlib
+import os
+import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+try:
+    from lxml import etree  # Optional: C parser for --strip-elements
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# File name endings converted by this script
+HTML_SUFFIXES = (".html", ".htm")
+
+# Elements removed by --strip-elements
+STRIP_TAGS = ("script", "style", "nav", "footer", "header", "noscript")
+
+# --fast-strip: drops each element with its content without parsing the page.
+# Only correct for well-formed HTML where these elements are not nested in
+# themselves and their closing tags do not appear inside scripts or comments
+STRIP_RE = re.compile(
+    r"<(%s)(?=[\s/>])[^>]*>.*?</\1\s*>" % "|".join(STRIP_TAGS),
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def iter_files(root: str):
+    """Yield a DirEntry for every file under root (symlinked directories are not entered)."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directory: skipped, as rglob does
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.is_file():
+                yield entry
+
 
 def find_html_files(root_dir: Path, exclude_patterns: list[str] = None) -> list[Path]:
     """Recursively find all HTML files in directory."""
     exclude_patterns = exclude_patterns or []
     html_files = []
     
-    for html_file in root_dir.rglob("*.html"):
-        # Check exclusion patterns
-        excluded = False
-        for pattern in exclude_patterns:
-            if html_file.match(pattern):
-                excluded = True
-                break
+    # One scandir walk for both extensions; the name test runs on the
+    # DirEntry and a Path is built only for matching files.
+    # normcase keeps glob's case rules (insensitive on Windows only)
+    for entry in iter_files(root_dir):
+        if not os.path.normcase(entry.name).endswith(HTML_SUFFIXES):
+            continue
+        html_file = Path(entry.path)
         
-        if not excluded:
+        # Check exclusion patterns
+        if not any(html_file.match(pattern) for pattern in exclude_patterns):
             html_files.append(html_file)
     
-    # Also check for .htm files
-    for htm_file in root_dir.rglob("*.htm"):
-        excluded = False
-        for pattern in exclude_patterns:
-            if htm_file.match(pattern):
-                excluded = True
-                break
-        
-        if not excluded:
-            html_files.append(htm_file)
-    
     return sorted(html_files)
 
 
-def strip_unwanted_elements(html_content: str) -> str:
+def file_digest(path: Path) -> bytes:
+    """SHA-256 of a file's content, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def strip_unwanted_elements(html_content: str, fast: bool = False) -> str:
     """Remove script, style, nav, footer, header elements from HTML."""
+    if fast:
+        return STRIP_RE.sub("", html_content)
+    
+    if lxml_html is not None and html_content.strip():
+        # libxml2 parses and strips in C; BeautifulSoup is the fallback
+        try:
+            document = lxml_html.document_fromstring(html_content)
+        except (etree.ParserError, ValueError):
+            pass
+        else:
+            # with_tail=False keeps the text that follows a removed element
+            etree.strip_elements(document, *STRIP_TAGS, with_tail=False)
+            return lxml_html.tostring(document, encoding="unicode")
+    
     try:
         from bs4 import BeautifulSoup
         soup = BeautifulSoup(html_content, 'html.parser')
         
-        for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'noscript']):
+        for tag in soup(list(STRIP_TAGS)):
             tag.decompose()
         
         return str(soup)
@@ -65,30 +119,32 @@ def strip_unwanted_elements(html_content: str) -> str:
         return html_content
 
 
+def pandoc_command(output_format: str = "markdown", wrap_mode: str = "none") -> tuple[str, ...]:
+    """pandoc arguments shared by every file of a run (all but input and output)."""
+    return ("pandoc", "-f", "html", "-t", output_format, f"--wrap={wrap_mode}")
+
+
 def convert_html_to_markdown(
     html_file: Path,
     output_file: Path,
     wrap_mode: str = "none",
     output_format: str = "markdown",
-    strip_elements: bool = False
+    strip_elements: bool = False,
+    fast_strip: bool = False,
+    base_cmd: tuple[str, ...] = None
 ) -> bool:
     """Convert a single HTML file to Markdown using pandoc."""
     
     try:
-        # Build pandoc command
-        cmd = [
-            "pandoc",
-            "-f", "html",
-            "-t", output_format,
-            f"--wrap={wrap_mode}",
-        ]
+        # Batch runs pass the pandoc_command() they built once
+        cmd = list(base_cmd or pandoc_command(output_format, wrap_mode))
         
         if strip_elements:
             # Read, strip, and pipe to pandoc
             with open(html_file, 'r', encoding='utf-8', errors='replace') as f:
                 html_content = f.read()
             
-            html_content = strip_unwanted_elements(html_content)
+            html_content = strip_unwanted_elements(html_content, fast_strip)
             
             cmd.extend(["-o", str(output_file)])
             
@@ -127,6 +183,9 @@ def main():
     parser.add_argument("--exclude", action="append", default=[], help="Patterns to exclude")
     parser.add_argument("--strip-elements", action="store_true", 
                        help="Strip script, style, nav, footer, header elements")
+    parser.add_argument("--fast-strip", action="store_true",
+                       help="With --strip-elements, strip with a regex instead of "
+                            "parsing (trusted, well-formed HTML only)")
     
     args = parser.parse_args()
     
@@ -134,10 +193,8 @@ def main():
         print(f"Error: Directory not found: {args.directory}", file=sys.stderr)
         sys.exit(1)
     
-    # Check pandoc is installed
-    try:
-        subprocess.run(["pandoc", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check pandoc is installed (a PATH lookup, no process is started)
+    if shutil.which("pandoc") is None:
         print("Error: pandoc is not installed or not in PATH", file=sys.stderr)
         sys.exit(1)
     
@@ -152,6 +209,14 @@ def main():
     success_count = 0
     fail_count = 0
     
+    # Identical pages (mirrors, copied course packets) are converted once;
+    # later copies reuse that Markdown. written_by records whose content each
+    # output holds, so a reused output overwritten by another page (x.html
+    # and x.htm both map to x.md) is no longer copied from.
+    converted = {}
+    written_by = {}
+    base_cmd = pandoc_command(args.format, args.wrap)
+    
     for html_file in html_files:
         # Determine output path
         if args.output_dir:
@@ -174,12 +239,40 @@ def main():
         # Create output directory if needed
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
+        try:
+            digest = file_digest(html_file)
+        except OSError:
+            digest = None  # Reported by the conversion below
+        
+        # Whatever this page leaves at output_file, it is no longer the
+        # Markdown of the page written there before
+        previous = written_by.pop(output_file, None)
+        if previous is not None and previous != digest and converted.get(previous) == output_file:
+            del converted[previous]
+        
+        if digest in converted:
+            source = converted[digest]
+            print(f"Converting: {html_file} -> {output_file} (copy of {source}, same content)")
+            try:
+                if source != output_file:
+                    shutil.copyfile(source, output_file)
+                written_by[output_file] = digest
+                success_count += 1
+            except OSError as e:
+                print(f"Error copying {source} to {output_file}: {e}", file=sys.stderr)
+                fail_count += 1
+            continue
+        
         print(f"Converting: {html_file} -> {output_file}")
         
         if convert_html_to_markdown(
-            html_file, output_file, args.wrap, args.format, args.strip_elements
+            html_file, output_file, args.wrap, args.format, args.strip_elements,
+            args.fast_strip, base_cmd
         ):
             success_count += 1
+            if digest is not None:
+                converted[digest] = output_file
+                written_by[output_file] = digest
         else:
             fail_count += 1
     
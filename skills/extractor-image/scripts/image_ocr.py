@@ -2,14 +2,21 @@
 """
 Image OCR - Extract text from images using pytesseract.
 
+When tesserocr is installed, OCR runs in-process through libtesseract and
+each process loads the language model once instead of once per image.
+
 Usage:
     python image_ocr.py IMAGE [OPTIONS]
     python image_ocr.py --dir DIRECTORY [OPTIONS]
 """
 
 import argparse
+import atexit
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
@@ -23,8 +30,82 @@ except ImportError:
     )
     sys.exit(1)
 
+try:
+    import tesserocr  # Optional: in-process libtesseract, model loaded once per process
+except ImportError:
+    tesserocr = None
+
 SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".tif"}
 
+# tesserocr engines of this process, one per (lang, psm), reused across images
+_TESSEROCR_APIS = {}
+
+
+def get_tesserocr_api(lang: str, psm: int):
+    """Return this process's tesserocr engine for (lang, psm), creating it once."""
+    api = _TESSEROCR_APIS.get((lang, psm))
+    if api is None:
+        api = tesserocr.PyTessBaseAPI(lang=lang, psm=psm)
+        atexit.register(api.End)
+        _TESSEROCR_APIS[(lang, psm)] = api
+    return api
+
+
+def ocr_with_tesserocr(img, lang: str, dpi: int, psm: int) -> tuple[str, float]:
+    """OCR an image in-process; returns (text, mean word confidence)."""
+    # Same alpha handling as pytesseract: flatten onto a white background
+    if "A" in img.getbands():
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, (0, 0), img.getchannel("A"))
+        img = background
+
+    api = get_tesserocr_api(lang, psm)
+    api.SetImage(img)
+    api.SetSourceResolution(dpi)
+    return api.GetUTF8Text(), api.MeanTextConf()
+
+
+def text_from_data(data: dict) -> str:
+    """
+    Rebuild plain text from image_to_data output the way Tesseract's text
+    renderer lays it out: words joined by spaces, one line per text line,
+    a blank line between paragraphs.
+    """
+    paragraphs = {}
+    for i, word in enumerate(data["text"]):
+        # Level 5 rows are words; the others are page/block/paragraph/line boxes
+        if data["level"][i] != 5 or not word.strip():
+            continue
+        paragraph = (data["page_num"][i], data["block_num"][i], data["par_num"][i])
+        paragraphs.setdefault(paragraph, {}).setdefault(data["line_num"][i], []).append(word)
+
+    return "\n\n".join(
+        "\n".join(" ".join(words) for words in lines.values())
+        for lines in paragraphs.values()
+    )
+
+
+def ocr_with_pytesseract(img, lang: str, dpi: int, psm: int) -> tuple[str, float]:
+    """OCR an image with the tesseract binary; returns (text, mean word confidence)."""
+    # Configure tesseract
+    config = f"--dpi {dpi} --psm {psm}"
+
+    # One Tesseract run gives both the words and their confidences
+    try:
+        data = pytesseract.image_to_data(
+            img, lang=lang, config=config, output_type=pytesseract.Output.DICT
+        )
+
+        # Calculate average confidence (excluding empty entries)
+        confidences = [int(c) for c in data["conf"] if int(c) > 0]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        return text_from_data(data), avg_confidence
+    except pytesseract.TesseractNotFoundError:
+        raise
+    except Exception:
+        # Fall back to plain text extraction without confidences
+        return pytesseract.image_to_string(img, lang=lang, config=config), 0
+
 
 def extract_text(
     image_path: str, lang: str = "eng", dpi: int = 300, psm: int = 3
@@ -39,25 +120,14 @@ def extract_text(
         return {"error": f"Unsupported image format: {path.suffix}"}
 
     try:
-        img = Image.open(image_path)
-
-        # Configure tesseract
-        config = f"--dpi {dpi} --psm {psm}"
+        # Decode the file once; the handle is closed as soon as OCR is done
+        with Image.open(image_path) as img:
+            img.load()
 
-        # Get OCR data with confidence
-        try:
-            data = pytesseract.image_to_data(
-                img, lang=lang, config=config, output_type=pytesseract.Output.DICT
-            )
-
-            # Calculate average confidence (excluding empty entries)
-            confidences = [int(c) for c in data["conf"] if int(c) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-        except Exception:
-            avg_confidence = 0
-
-        # Extract text
-        text = pytesseract.image_to_string(img, lang=lang, config=config)
+            if tesserocr is not None:
+                text, avg_confidence = ocr_with_tesserocr(img, lang, dpi, psm)
+            else:
+                text, avg_confidence = ocr_with_pytesseract(img, lang, dpi, psm)
 
         return {
             "source": str(path.absolute()),
@@ -75,6 +145,22 @@ def extract_text(
         return {"error": str(e), "source": str(path.absolute())}
 
 
+def iter_files(root: str):
+    """Yield a DirEntry for every file under root (symlinked directories are not entered)."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directory: skipped, as rglob does
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
 def process_directory(
     dir_path: str,
     output_dir: Optional[str],
@@ -82,26 +168,61 @@ def process_directory(
     dpi: int,
     psm: int,
     quiet: bool,
+    workers: int = 1,
 ) -> list:
-    """Process all images in directory."""
+    """Process all images in directory, OCRing up to `workers` at a time."""
     results = []
     dir_path_obj = Path(dir_path)
 
     if not dir_path_obj.exists() or not dir_path_obj.is_dir():
         return [{"error": f"Invalid directory: {dir_path}"}]
 
-    for ext in SUPPORTED_EXTENSIONS:
-        for img_file in dir_path_obj.rglob(f"*{ext}"):
+    # One scandir walk of the tree, filtered by extension (any case, as
+    # extract_text allows) before a Path is built for the entry
+    image_files = sorted(
+        Path(entry.path)
+        for entry in iter_files(dir_path)
+        if os.path.splitext(entry.name)[1].lower() in SUPPORTED_EXTENSIONS
+    )
+
+    ocr = partial(extract_text, lang=lang, dpi=dpi, psm=psm)
+    workers = max(1, min(workers, len(image_files)))
+    executor = None
+    if workers == 1:
+        ocr_results = map(ocr, map(str, image_files))
+    else:
+        # Tesseract is CPU-bound: one image per core, each Tesseract single-threaded
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        executor = ProcessPoolExecutor(max_workers=workers)
+        ocr_results = executor.map(ocr, map(str, image_files))
+
+    # Text files are written on a background thread while the next image is
+    # OCRed; a single writer keeps same-stem outputs in file order
+    writer = None
+    writes = []
+    if output_dir:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        writer = ThreadPoolExecutor(max_workers=1)
+
+    try:
+        for img_file, result in zip(image_files, ocr_results):
             if not quiet:
                 print(f"Processing: {img_file}", file=sys.stderr)
 
-            result = extract_text(str(img_file), lang, dpi, psm)
             results.append(result)
 
-            if output_dir and "text" in result and result["text"]:
+            if writer is not None and "text" in result and result["text"]:
                 out_path = Path(output_dir) / f"{img_file.stem}.txt"
-                out_path.parent.mkdir(parents=True, exist_ok=True)
-                out_path.write_text(result["text"], encoding="utf-8")
+                writes.append(writer.submit(out_path.write_text, result["text"], encoding="utf-8"))
+
+        # Surface any write error, as the inline writes did
+        for write in writes:
+            write.result()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if writer is not None:
+            writer.shutdown()
 
     return results
 
@@ -138,6 +259,13 @@ def main():
     parser.add_argument(
         "--psm", type=int, default=3, help="Page segmentation mode (default: 3)"
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Images OCRed in parallel with --dir (default: CPU count)",
+    )
     parser.add_argument(
         "-q", "--quiet", action="store_true", help="Suppress progress output"
     )
@@ -147,7 +275,7 @@ def main():
     # Directory mode
     if args.dir:
         results = process_directory(
-            args.dir, args.output, args.lang, args.dpi, args.psm, args.quiet
+            args.dir, args.output, args.lang, args.dpi, args.psm, args.quiet, args.workers
         )
         if args.json:
             print(json.dumps(results, indent=2))
@@ -11,14 +11,23 @@ Usage:
     python pdf_extract.py document.pdf -f txt             # Extract to plain text
     python pdf_extract.py document.pdf --tables           # Also extract tables to CSV
     python pdf_extract.py document.pdf --ocr              # Use OCR for scanned docs
+    python pdf_extract.py --dir ./pdfs --auto-ocr         # OCR only the scanned PDFs
     python pdf_extract.py --dir /path/to/pdfs -o ./out    # Batch process directory
 """
 
 import argparse
+import atexit
 import csv
+import hashlib
+import json
+import os
 import sys
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     import pdfplumber
@@ -26,39 +35,167 @@ except ImportError:
     print("ERROR: pdfplumber is required. Install with: pip install pdfplumber", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import pymupdf  # Optional: PyMuPDF, much faster text extraction than pdfplumber
+except ImportError:
+    pymupdf = None
+
+try:
+    import pytesseract  # Optional: needed for --ocr
+    from pdf2image import convert_from_path, pdfinfo_from_path
+    from PIL import Image
+except ImportError:
+    pytesseract = convert_from_path = None
+
+try:
+    import tesserocr  # Optional: in-process libtesseract, model loaded once per process
+except ImportError:
+    tesserocr = None
 
-def extract_text(pdf_path: Path) -> str:
-    """Extract text content from PDF using pdfplumber."""
-    text_parts = []
+# Text is extracted with PyMuPDF when it is installed, pdfplumber otherwise
+# (tables always use pdfplumber)
+TEXT_ENGINE = "pymupdf" if pymupdf is not None else "pdfplumber"
+
+
+def extract_text(pdf_path: Path, engine: str = TEXT_ENGINE) -> str:
+    """Extract text content from PDF using the given engine."""
+    return "\n\n".join(iter_pages(pdf_path, engine))
+
+
+def iter_pages(pdf_path: Path, engine: str = TEXT_ENGINE) -> Iterator[str]:
+    """Yield a "## Page N" section for each page with text, one page at a time."""
+    if engine == "pymupdf":
+        yield from iter_pages_pymupdf(pdf_path)
+        return
 
     with pdfplumber.open(pdf_path) as pdf:
         for i, page in enumerate(pdf.pages):
             page_text = page.extract_text()
+            # Drop the page's parsed objects; pdfplumber otherwise keeps every
+            # page's layout in memory until the document is closed
+            page.close()
             if page_text:
-                text_parts.append(f"## Page {i + 1}\n\n{page_text}")
+                yield f"## Page {i + 1}\n\n{page_text}"
 
-    return "\n\n".join(text_parts)
 
+def iter_pages_pymupdf(pdf_path: Path) -> Iterator[str]:
+    """Yield page sections using PyMuPDF."""
+    with pymupdf.open(str(pdf_path)) as doc:
+        for i, page in enumerate(doc):
+            page_text = page.get_text("text").rstrip()
+            if page_text:
+                yield f"## Page {i + 1}\n\n{page_text}"
+
+
+# --auto-ocr: a PDF averaging fewer characters of text layer per page than
+# this, with images on some page, is treated as a scan and OCRed
+OCR_AUTO_MIN_CHARS = 100
+
+
+def needs_ocr(pdf_path: Path) -> bool:
+    """
+    Decide whether a PDF looks scanned rather than born-digital: little text
+    layer per page and at least one page image. Stops reading as soon as
+    enough text has been seen, so born-digital PDFs cost a few pages.
+    """
+    if pymupdf is not None:
+        with pymupdf.open(str(pdf_path)) as doc:
+            min_chars = OCR_AUTO_MIN_CHARS * doc.page_count
+            chars = 0
+            has_images = False
+            for page in doc:
+                chars += len(page.get_text("text").strip())
+                if chars >= min_chars:
+                    return False
+                has_images = has_images or bool(page.get_images())
+            return has_images
+
+    with pdfplumber.open(pdf_path) as pdf:
+        min_chars = OCR_AUTO_MIN_CHARS * len(pdf.pages)
+        chars = 0
+        has_images = False
+        for page in pdf.pages:
+            chars += len((page.extract_text() or "").strip())
+            has_images = has_images or bool(page.images)
+            page.close()
+            if chars >= min_chars:
+                return False
+        return has_images
 
-def extract_text_ocr(pdf_path: Path) -> str:
-    """Extract text from scanned PDF using OCR."""
+
+def extract_text_ocr(pdf_path: Path, workers: int = 1) -> str:
+    """Extract text from scanned PDF using OCR, up to `workers` pages at a time."""
+    return "\n\n".join(iter_pages_ocr(pdf_path, workers))
+
+
+# This process's tesserocr engine, reused for every page it OCRs
+_TESSEROCR_API = None
+
+
+def get_tesserocr_api():
+    """Return this process's tesserocr engine, creating it once."""
+    global _TESSEROCR_API
+    if _TESSEROCR_API is None:
+        _TESSEROCR_API = tesserocr.PyTessBaseAPI()
+        atexit.register(_TESSEROCR_API.End)
+    return _TESSEROCR_API
+
+
+def ocr_page_file(image_path: str) -> str:
+    """OCR one rendered page image, deleting the image afterwards."""
     try:
-        import pytesseract
-        from pdf2image import convert_from_path
-    except ImportError:
+        with Image.open(image_path) as img:
+            if tesserocr is not None:
+                api = get_tesserocr_api()
+                api.SetImage(img)
+                return api.GetUTF8Text()
+            return pytesseract.image_to_string(img)
+    finally:
+        os.unlink(image_path)
+
+
+def iter_pages_ocr(pdf_path: Path, workers: int = 1) -> Iterator[str]:
+    """Yield OCRed page sections, up to `workers` pages OCRed at a time."""
+    if pytesseract is None or convert_from_path is None:
         print("ERROR: OCR requires pytesseract and pdf2image. Install with:", file=sys.stderr)
         print("  pip install pytesseract pdf2image", file=sys.stderr)
         sys.exit(1)
 
-    text_parts = []
-    images = convert_from_path(str(pdf_path))
+    page_count = pdfinfo_from_path(str(pdf_path))["Pages"]
 
-    for i, image in enumerate(images):
-        page_text = pytesseract.image_to_string(image)
-        if page_text.strip():
-            text_parts.append(f"## Page {i + 1}\n\n{page_text}")
+    workers = max(1, min(workers, page_count))
+    executor = None
+    if workers > 1:
+        # Tesseract is CPU-bound: one page per core, each Tesseract single-threaded
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        executor = ProcessPoolExecutor(max_workers=workers)
 
-    return "\n\n".join(text_parts)
+    # Pages are rasterized to disk `workers` at a time, and the next batch is
+    # only rendered once the one before last has been OCRed, so at most two
+    # batches of page images exist whatever the length of the document
+    pending = deque()
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for first in range(1, page_count + 1, workers):
+                image_paths = convert_from_path(
+                    str(pdf_path), first_page=first, last_page=min(first + workers - 1, page_count),
+                    output_folder=tmpdir, paths_only=True,
+                )
+                for i, image_path in enumerate(image_paths, first):
+                    if executor is None:
+                        pending.append((i, ocr_page_file(image_path)))
+                    else:
+                        pending.append((i, executor.submit(ocr_page_file, image_path)))
+
+                while len(pending) > workers or (pending and first + workers > page_count):
+                    i, page_text = pending.popleft()
+                    if executor is not None:
+                        page_text = page_text.result()
+                    if page_text.strip():
+                        yield f"## Page {i}\n\n{page_text}"
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
 
 def extract_tables(pdf_path: Path, output_dir: Path) -> list[Path]:
@@ -69,35 +206,141 @@ def extract_tables(pdf_path: Path, output_dir: Path) -> list[Path]:
     with pdfplumber.open(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages):
             tables = page.extract_tables()
+            page.close()
             for table_idx, table in enumerate(tables):
                 if table and len(table) > 0:
                     table_count += 1
                     csv_path = output_dir / f"{pdf_path.stem}_table_{table_count}.csv"
 
-                    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-                        writer = csv.writer(f)
-                        for row in table:
-                            # Clean up None values
-                            cleaned_row = [cell if cell is not None else "" for cell in row]
-                            writer.writerow(cleaned_row)
+                    # The whole table in one writerows call; csv writes the
+                    # None of empty cells as "", so no per-row clean-up is needed
+                    with open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                        csv.writer(f).writerows(table)
 
                     csv_files.append(csv_path)
 
     return csv_files
 
 
-def process_file(pdf_path: Path, output_dir: Path, fmt: str, use_ocr: bool, extract_tbls: bool) -> dict:
-    """Process a single PDF file."""
-    result = {"text_file": None, "table_files": [], "error": None}
+# Per-output-directory record of finished extractions, so --dir re-runs
+# skip inputs whose content and options are unchanged
+EXTRACT_CACHE_NAME = ".extract_cache.json"
+
+
+def file_digest(path: Path) -> str:
+    """BLAKE2b hash of a file's content, read in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_key(path: Path, *options) -> str:
+    """Cache key for an input: absolute path, content hash and extraction options."""
+    return "|".join([os.path.abspath(path), file_digest(path), *map(str, options)])
+
+
+def _load_extract_cache(output_dir: Path) -> dict:
+    """Read the extraction cache; a missing or corrupt file is empty."""
+    try:
+        with open(output_dir / EXTRACT_CACHE_NAME, encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _output_fingerprints(output_dir: Path, names) -> dict:
+    """Size and modification time of each output, to notice one being replaced later."""
+    fingerprints = {}
+    for name in names:
+        st = (output_dir / name).stat()
+        fingerprints[name] = [st.st_size, st.st_mtime_ns]
+    return fingerprints
+
+
+def _outputs_intact(output_dir: Path, entry: dict) -> bool:
+    """True if every output of a cache entry is still the file that extraction wrote."""
+    try:
+        return _output_fingerprints(output_dir, entry["outputs"]) == entry["outputs"]
+    except (OSError, KeyError, TypeError):
+        return False
+
+
+def _prune_extract_cache(output_dir: Path, cache: dict, fresh: dict) -> dict:
+    """
+    Entries worth saving: this run's, plus older ones whose input still exists,
+    was not extracted again in this run, and whose outputs are untouched.
+    """
+    sources = {entry["source"] for entry in fresh.values()}
+    pruned = {}
+    for key, entry in {**cache, **fresh}.items():
+        if not isinstance(entry, dict):
+            continue
+        if key not in fresh and entry.get("source") in sources:
+            continue
+        if os.path.exists(entry.get("source", "")) and _outputs_intact(output_dir, entry):
+            pruned[key] = entry
+    return pruned
+
+
+def _save_extract_cache(output_dir: Path, cache: dict) -> None:
+    """Write the cache atomically."""
+    cache_file = output_dir / EXTRACT_CACHE_NAME
+    try:
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def iter_files(root, recursive: bool = False):
+    """
+    Yield a DirEntry for every file in root, then (recursive) in each
+    subdirectory in turn, in the same order as Path.glob. Symlinked files
+    are included; symlinked directories are not entered.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return  # Unreadable directory: skipped, as Path.glob does
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.is_file():
+            yield entry
+
+    if recursive:
+        for subdir in subdirs:
+            yield from iter_files(subdir, recursive)
+
+
+def process_file(pdf_path: Path, output_dir: Path, fmt: str, use_ocr: bool, extract_tbls: bool,
+                 engine: str = TEXT_ENGINE, ocr_workers: int = 1, auto_ocr: bool = False) -> dict:
+    """
+    Process a single PDF file (ocr_workers: pages OCRed in parallel;
+    auto_ocr: OCR only if the PDF looks scanned).
+    """
+    result = {"text_file": None, "table_files": [], "error": None, "ocr": use_ocr}
 
     try:
-        # Extract text
+        if auto_ocr and not use_ocr:
+            use_ocr = result["ocr"] = needs_ocr(pdf_path)
+
+        # Extract text, one page at a time
         if use_ocr:
-            text = extract_text_ocr(pdf_path)
+            pages = iter_pages_ocr(pdf_path, ocr_workers)
         else:
-            text = extract_text(pdf_path)
+            pages = iter_pages(pdf_path, engine)
 
-        if not text.strip():
+        first_page = next(pages, None)
+        if first_page is None:
             result["error"] = "No text extracted (try --ocr for scanned documents)"
             return result
 
@@ -105,13 +348,19 @@ def process_file(pdf_path: Path, output_dir: Path, fmt: str, use_ocr: bool, extr
         ext = ".md" if fmt == "md" else ".txt"
         output_path = output_dir / f"{pdf_path.stem}{ext}"
 
-        if fmt == "md":
-            content = f"# {pdf_path.stem}\n\n{text}"
-        else:
-            content = text
-
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Pages are written as they are extracted instead of joined in memory
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                if fmt == "md":
+                    f.write(f"# {pdf_path.stem}\n\n")
+                f.write(first_page)
+                for page in pages:
+                    f.write("\n\n")
+                    f.write(page)
+        except BaseException:
+            # No partial output for a document that failed midway
+            output_path.unlink(missing_ok=True)
+            raise
 
         result["text_file"] = output_path
 
@@ -125,6 +374,23 @@ def process_file(pdf_path: Path, output_dir: Path, fmt: str, use_ocr: bool, extr
     return result
 
 
+def group_by_stem(paths: list[Path]) -> list[list[Path]]:
+    """
+    Group inputs that write the same output files (same stem), in order of
+    first appearance; a group runs in one worker, in file order, so the last
+    one wins as in a serial run.
+    """
+    groups = {}
+    for path in paths:
+        groups.setdefault(path.stem, []).append(path)
+    return list(groups.values())
+
+
+def process_serially(process, paths: list[Path]) -> list:
+    """Run process over paths one at a time (a worker's share of a batch)."""
+    return [process(path) for path in paths]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract PDF document content to text/markdown format",
@@ -143,6 +409,9 @@ Examples:
   # Use OCR for scanned documents
   python pdf_extract.py scanned.pdf --ocr
 
+  # OCR only the PDFs without a text layer
+  python pdf_extract.py --dir /path/to/pdfs --auto-ocr
+
   # Batch process directory
   python pdf_extract.py --dir /path/to/pdfs -o ./extracted
         """
@@ -161,13 +430,33 @@ Examples:
                         help="Recursive directory scan")
     parser.add_argument("--tables", action="store_true",
                         help="Also extract tables to CSV")
-    parser.add_argument("--ocr", action="store_true",
-                        help="Use OCR for scanned documents")
+    ocr_mode = parser.add_mutually_exclusive_group()
+    ocr_mode.add_argument("--ocr", action="store_true",
+                          help="Use OCR for scanned documents")
+    ocr_mode.add_argument("--auto-ocr", action="store_true",
+                          help="Use OCR only for PDFs with little or no text layer")
+    parser.add_argument("--engine", choices=["pymupdf", "pdfplumber"], default=TEXT_ENGINE,
+                        help="Text extraction engine (default: pymupdf if installed, else pdfplumber)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="PDFs processed in parallel with --dir, or pages OCRed "
+                             "in parallel for a single PDF (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="With --dir, re-extract PDFs even if unchanged since the last run")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
 
     args = parser.parse_args()
 
+    if args.engine == "pymupdf" and pymupdf is None:
+        print("ERROR: --engine pymupdf requires PyMuPDF.", file=sys.stderr)
+        print("Install with: pip install pymupdf", file=sys.stderr)
+        sys.exit(1)
+
+    if (args.ocr or args.auto_ocr) and (pytesseract is None or convert_from_path is None):
+        print("ERROR: OCR requires pytesseract and pdf2image. Install with:", file=sys.stderr)
+        print("  pip install pytesseract pdf2image", file=sys.stderr)
+        sys.exit(1)
+
     def log(msg):
         if not args.quiet:
             print(msg)
@@ -179,8 +468,11 @@ Examples:
             print(f"ERROR: Directory not found: {input_dir}", file=sys.stderr)
             sys.exit(1)
 
-        pattern = "**/*.pdf" if args.recursive else "*.pdf"
-        pdf_files = list(input_dir.glob(pattern))
+        # Name test on the DirEntry; normcase keeps glob's case rules
+        pdf_files = [
+            Path(entry.path) for entry in iter_files(input_dir, args.recursive)
+            if os.path.normcase(entry.name).endswith(".pdf")
+        ]
 
         if not pdf_files:
             print("No .pdf files found", file=sys.stderr)
@@ -197,17 +489,82 @@ Examples:
         failed = 0
         tables_extracted = 0
 
+        # PDFs whose content and options match the last run, with their
+        # outputs still as that run wrote them, are not extracted again
+        cache = {} if args.no_cache else _load_extract_cache(output_dir)
+        fresh = {}
+        cache_keys = {}
+        cached = {}
         for pdf_path in pdf_files:
-            result = process_file(pdf_path, output_dir, args.format, args.ocr, args.tables)
+            try:
+                key = cache_keys[pdf_path] = _cache_key(
+                    pdf_path, args.format, "auto" if args.auto_ocr else args.ocr, args.tables,
+                    args.engine)
+            except OSError:
+                continue  # process_file reports it
+            entry = cache.get(key)
+            if entry and _outputs_intact(output_dir, entry):
+                cached[pdf_path] = {
+                    "text_file": output_dir / entry["text_file"],
+                    "table_files": [output_dir / name for name in entry["table_files"]],
+                    "error": None,
+                }
+        pending = [pdf_path for pdf_path in pdf_files if pdf_path not in cached]
+
+        # Parsing and OCR are CPU-bound and independent per PDF: one process
+        # per document, results logged in file order
+        process = partial(process_serially, partial(
+            process_file, output_dir=output_dir, fmt=args.format, use_ocr=args.ocr,
+            extract_tbls=args.tables, engine=args.engine, auto_ocr=args.auto_ocr))
+        groups = group_by_stem(pending)
+        workers = max(1, min(args.workers, len(groups)))
+        executor = None
+        if workers == 1:
+            batches = zip(groups, map(process, groups))
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            batches = zip(groups, executor.map(process, groups))
+
+        done = {}
 
+        for pdf_path in pdf_files:
+            if pdf_path in cached:
+                result = cached[pdf_path]
+                log(f"  {pdf_path.name} -> {result['text_file'].name} (unchanged)")
+                exported += 1
+                tables_extracted += len(result["table_files"])
+                continue
+
+            # Groups come back in the order of their first PDF
+            if pdf_path not in done:
+                group, group_results = next(batches)
+                done.update(zip(group, group_results))
+            result = done.pop(pdf_path)
             if result["text_file"]:
-                log(f"  {pdf_path.name} -> {result['text_file'].name}")
+                log(f"  {pdf_path.name} -> {result['text_file'].name}"
+                    + (" (OCR)" if args.auto_ocr and result["ocr"] else ""))
                 exported += 1
                 tables_extracted += len(result["table_files"])
+                if pdf_path in cache_keys:
+                    names = [result["text_file"].name, *(path.name for path in result["table_files"])]
+                    try:
+                        fresh[cache_keys[pdf_path]] = {
+                            "source": os.path.abspath(pdf_path),
+                            "text_file": names[0],
+                            "table_files": names[1:],
+                            "outputs": _output_fingerprints(output_dir, names),
+                        }
+                    except OSError:
+                        pass
             else:
                 log(f"  {pdf_path.name} - FAILED: {result['error']}")
                 failed += 1
 
+        if executor is not None:
+            executor.shutdown()
+        if not args.no_cache:
+            _save_extract_cache(output_dir, _prune_extract_cache(output_dir, cache, fresh))
+
         log(f"\nExtracted {exported} PDFs to: {output_dir}")
         if tables_extracted:
             log(f"Tables extracted: {tables_extracted}")
@@ -234,10 +591,13 @@ Examples:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         log(f"Extracting: {pdf_path.name}")
-        result = process_file(pdf_path, output_dir, args.format, args.ocr, args.tables)
+        # A single document has its OCR pages spread over the workers instead
+        result = process_file(pdf_path, output_dir, args.format, args.ocr, args.tables, args.engine,
+                              ocr_workers=args.workers, auto_ocr=args.auto_ocr)
 
         if result["text_file"]:
-            log(f"Output: {result['text_file']}")
+            log(f"Output: {result['text_file']}"
+                + (" (OCR)" if args.auto_ocr and result["ocr"] else ""))
             if result["table_files"]:
                 log(f"Tables: {len(result['table_files'])} CSV files")
         else:
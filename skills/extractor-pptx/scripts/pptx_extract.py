@@ -14,7 +14,12 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
@@ -24,19 +29,33 @@ except ImportError:
     print("ERROR: markitdown is required. Install with: pip install markitdown", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from pptx import Presentation  # Optional: needed for --notes and as the markitdown fallback
+except ImportError:
+    Presentation = None
+
+# MarkItDown converter shared by every file of a run (it registers all its
+# converters on construction)
+_MARKITDOWN = None
+
+
+def get_markitdown() -> MarkItDown:
+    """Return this process's MarkItDown instance, creating it once."""
+    global _MARKITDOWN
+    if _MARKITDOWN is None:
+        _MARKITDOWN = MarkItDown()
+    return _MARKITDOWN
+
 
 def extract_with_markitdown(pptx_path: Path) -> str:
     """Extract presentation content using markitdown."""
-    md = MarkItDown()
-    result = md.convert(str(pptx_path))
+    result = get_markitdown().convert(str(pptx_path))
     return result.text_content
 
 
 def extract_with_python_pptx(pptx_path: Path, include_notes: bool = False) -> str:
     """Extract presentation content using python-pptx (fallback method with notes support)."""
-    try:
-        from pptx import Presentation
-    except ImportError:
+    if Presentation is None:
         print("ERROR: python-pptx is required for --notes. Install with: pip install python-pptx", file=sys.stderr)
         sys.exit(1)
 
@@ -46,10 +65,12 @@ def extract_with_python_pptx(pptx_path: Path, include_notes: bool = False) -> st
     for slide_num, slide in enumerate(prs.slides, 1):
         slide_text = []
 
+        # Look the title up once per slide: each access walks the shape tree
+        title_shape = slide.shapes.title
+
         # Extract title if present
-        if slide.shapes.title:
-            title = slide.shapes.title.text
-            slide_text.append(f"## Slide {slide_num}: {title}")
+        if title_shape:
+            slide_text.append(f"## Slide {slide_num}: {title_shape.text}")
         else:
             slide_text.append(f"## Slide {slide_num}")
 
@@ -57,17 +78,14 @@ def extract_with_python_pptx(pptx_path: Path, include_notes: bool = False) -> st
 
         # Extract text from shapes
         for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                # Skip if it's the title we already added
-                if shape == slide.shapes.title:
-                    continue
-
-                text = shape.text.strip()
-                # Format as bullet points if multiple lines
-                lines = text.split("\n")
-                for line in lines:
-                    if line.strip():
-                        slide_text.append(f"- {line.strip()}")
+            # Skip the title we already added
+            if shape == title_shape or not hasattr(shape, "text"):
+                continue
+
+            # Format as bullet points, one per non-blank line (text is built
+            # from the XML on every access, so read it once)
+            text = shape.text
+            slide_text.extend(f"- {line.strip()}" for line in text.strip().split("\n") if line.strip())
 
         # Extract speaker notes if requested
         if include_notes and slide.has_notes_slide:
@@ -81,6 +99,105 @@ def extract_with_python_pptx(pptx_path: Path, include_notes: bool = False) -> st
     return "\n\n".join(slides_content)
 
 
+# Per-output-directory record of finished extractions, so --dir re-runs
+# skip inputs whose content and options are unchanged
+EXTRACT_CACHE_NAME = ".extract_cache.json"
+
+
+def file_digest(path: Path) -> str:
+    """BLAKE2b hash of a file's content, read in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_key(path: Path, *options) -> str:
+    """Cache key for an input: absolute path, content hash and extraction options."""
+    return "|".join([os.path.abspath(path), file_digest(path), *map(str, options)])
+
+
+def _load_extract_cache(output_dir: Path) -> dict:
+    """Read the extraction cache; a missing or corrupt file is empty."""
+    try:
+        with open(output_dir / EXTRACT_CACHE_NAME, encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _output_fingerprints(output_dir: Path, names) -> dict:
+    """Size and modification time of each output, to notice one being replaced later."""
+    fingerprints = {}
+    for name in names:
+        st = (output_dir / name).stat()
+        fingerprints[name] = [st.st_size, st.st_mtime_ns]
+    return fingerprints
+
+
+def _outputs_intact(output_dir: Path, entry: dict) -> bool:
+    """True if every output of a cache entry is still the file that extraction wrote."""
+    try:
+        return _output_fingerprints(output_dir, entry["outputs"]) == entry["outputs"]
+    except (OSError, KeyError, TypeError):
+        return False
+
+
+def _prune_extract_cache(output_dir: Path, cache: dict, fresh: dict) -> dict:
+    """
+    Entries worth saving: this run's, plus older ones whose input still exists,
+    was not extracted again in this run, and whose outputs are untouched.
+    """
+    sources = {entry["source"] for entry in fresh.values()}
+    pruned = {}
+    for key, entry in {**cache, **fresh}.items():
+        if not isinstance(entry, dict):
+            continue
+        if key not in fresh and entry.get("source") in sources:
+            continue
+        if os.path.exists(entry.get("source", "")) and _outputs_intact(output_dir, entry):
+            pruned[key] = entry
+    return pruned
+
+
+def _save_extract_cache(output_dir: Path, cache: dict) -> None:
+    """Write the cache atomically."""
+    cache_file = output_dir / EXTRACT_CACHE_NAME
+    try:
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def iter_files(root, recursive: bool = False):
+    """
+    Yield a DirEntry for every file in root, then (recursive) in each
+    subdirectory in turn, in the same order as Path.glob. Symlinked files
+    are included; symlinked directories are not entered.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return  # Unreadable directory: skipped, as Path.glob does
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.is_file():
+            yield entry
+
+    if recursive:
+        for subdir in subdirs:
+            yield from iter_files(subdir, recursive)
+
+
 def process_file(pptx_path: Path, output_dir: Path, fmt: str, include_notes: bool) -> Optional[Path]:
     """Process a single pptx file."""
     try:
@@ -117,6 +234,23 @@ def process_file(pptx_path: Path, output_dir: Path, fmt: str, include_notes: boo
         return None
 
 
+def group_by_stem(paths: list[Path]) -> list[list[Path]]:
+    """
+    Group inputs that write the same output file (same stem), in order of
+    first appearance; a group runs in one worker, in file order, so the last
+    one wins as in a serial run.
+    """
+    groups = {}
+    for path in paths:
+        groups.setdefault(path.stem, []).append(path)
+    return list(groups.values())
+
+
+def process_serially(process, paths: list[Path]) -> list:
+    """Run process over paths one at a time (a worker's share of a batch)."""
+    return [process(path) for path in paths]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract PowerPoint presentation content to text/markdown format",
@@ -150,6 +284,10 @@ Examples:
                         help="Recursive directory scan")
     parser.add_argument("--notes", action="store_true",
                         help="Include speaker notes")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Presentations processed in parallel with --dir (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="With --dir, re-extract presentations even if unchanged since the last run")
     parser.add_argument("-q", "--quiet", action="store_true",
                         help="Suppress progress output")
 
@@ -166,8 +304,11 @@ Examples:
             print(f"ERROR: Directory not found: {input_dir}", file=sys.stderr)
             sys.exit(1)
 
-        pattern = "**/*.pptx" if args.recursive else "*.pptx"
-        pptx_files = list(input_dir.glob(pattern))
+        # Name test on the DirEntry; normcase keeps glob's case rules
+        pptx_files = [
+            Path(entry.path) for entry in iter_files(input_dir, args.recursive)
+            if os.path.normcase(entry.name).endswith(".pptx")
+        ]
 
         if not pptx_files:
             print("No .pptx files found", file=sys.stderr)
@@ -183,16 +324,70 @@ Examples:
         exported = 0
         failed = 0
 
+        # Presentations whose content and options match the last run, with
+        # their output still as that run wrote it, are not extracted again
+        cache = {} if args.no_cache else _load_extract_cache(output_dir)
+        fresh = {}
+
+        cache_keys = {}
+        cached = {}
         for pptx_path in pptx_files:
-            result = process_file(pptx_path, output_dir, args.format, args.notes)
+            try:
+                key = cache_keys[pptx_path] = _cache_key(pptx_path, args.format, args.notes)
+            except OSError:
+                continue  # process_file reports it
+            entry = cache.get(key)
+            if entry and _outputs_intact(output_dir, entry):
+                cached[pptx_path] = entry
+        pending = [pptx_path for pptx_path in pptx_files if pptx_path not in cached]
+
+        # Conversion is CPU-bound and independent per presentation: one
+        # process per document, results logged in file order
+        process = partial(process_serially, partial(process_file, output_dir=output_dir,
+                                                    fmt=args.format, include_notes=args.notes))
+        groups = group_by_stem(pending)
+        workers = max(1, min(args.workers, len(groups)))
+        executor = None
+        if workers == 1:
+            batches = zip(groups, map(process, groups))
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            batches = zip(groups, executor.map(process, groups))
+
+        done = {}
+        for pptx_path in pptx_files:
+            if pptx_path in cached:
+                log(f"  {pptx_path.name} -> {cached[pptx_path]['output_file']} (unchanged)")
+                exported += 1
+                continue
+
+            # Groups come back in the order of their first presentation
+            if pptx_path not in done:
+                group, group_results = next(batches)
+                done.update(zip(group, group_results))
+            result = done.pop(pptx_path)
 
             if result:
                 log(f"  {pptx_path.name} -> {result.name}")
                 exported += 1
+                if pptx_path in cache_keys:
+                    try:
+                        fresh[cache_keys[pptx_path]] = {
+                            "source": os.path.abspath(pptx_path),
+                            "output_file": result.name,
+                            "outputs": _output_fingerprints(output_dir, [result.name]),
+                        }
+                    except OSError:
+                        pass
             else:
                 log(f"  {pptx_path.name} - FAILED")
                 failed += 1
 
+        if executor is not None:
+            executor.shutdown()
+        if not args.no_cache:
+            _save_extract_cache(output_dir, _prune_extract_cache(output_dir, cache, fresh))
+
         log(f"\nExtracted {exported} presentations to: {output_dir}")
         if failed:
             log(f"Failed: {failed} presentations")
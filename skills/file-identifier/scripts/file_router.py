@@ -9,10 +9,13 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import os
 import sys
 import zipfile
 from pathlib import Path
+from stat import S_ISREG
 from typing import Optional
 
 # Magic byte signatures: (offset, bytes, file_type, processor)
@@ -43,6 +46,14 @@ SIGNATURES = [
     (257, b"ustar", "tar", "archive-extractor"),  # tar magic at offset 257
 ]
 
+# Signatures worth checking for a given first header byte, in SIGNATURES order:
+# the offset-0 signatures starting with that byte plus every non-zero-offset one
+OFFSET_SIGNATURES = [sig for sig in SIGNATURES if sig[0] != 0]
+SIGNATURES_BY_FIRST_BYTE = {
+    first: [sig for sig in SIGNATURES if sig[0] != 0 or sig[1][:1] == first]
+    for first in {magic[:1] for offset, magic, _, _ in SIGNATURES if offset == 0}
+}
+
 # OOXML detection for Office docs (all start with PK zip signature)
 OOXML_TYPES = {
     "word/document.xml": ("docx", "extractor-docx"),
@@ -147,6 +158,17 @@ EXTENSION_MAP = {
     ".m4a": ("audio", "skip"),
 }
 
+# Multi-part extensions, checked only when the last suffix is one of their ends
+COMPOUND_EXTENSIONS = (".tar.gz", ".tar.bz2", ".tar.xz")
+COMPOUND_LAST_SUFFIXES = frozenset(ext[ext.rfind("."):] for ext in COMPOUND_EXTENSIONS)
+
+# Extensions routed without reading the file: text, code and media, where
+# no signature would change the route
+EXTENSION_AUTHORITATIVE = frozenset(
+    ext for ext, (_, processor) in EXTENSION_MAP.items()
+    if processor in ("passthrough", "skip")
+)
+
 
 def read_header(filepath: str, size: int = 512) -> bytes:
     """Read file header for signature detection."""
@@ -158,10 +180,13 @@ def detect_ooxml_type(filepath: str) -> Optional[tuple]:
     """Detect Office XML document type by inspecting zip contents."""
     try:
         with zipfile.ZipFile(filepath, "r") as zf:
-            names = zf.namelist()
+            # getinfo is a dict lookup; namelist() would copy every member name
             for marker, (file_type, processor) in OOXML_TYPES.items():
-                if marker in names:
-                    return (file_type, processor)
+                try:
+                    zf.getinfo(marker)
+                except KeyError:
+                    continue
+                return (file_type, processor)
     except (zipfile.BadZipFile, IOError):
         pass
     return None
@@ -169,46 +194,50 @@ def detect_ooxml_type(filepath: str) -> Optional[tuple]:
 
 def detect_by_signature(header: bytes, filepath: str) -> Optional[dict]:
     """Detect file type by magic bytes."""
-    for offset, magic, file_type, processor in SIGNATURES:
-        if len(header) >= offset + len(magic):
-            if header[offset : offset + len(magic)] == magic:
-                # Special handling for PK signature (could be zip or OOXML)
-                if file_type == "zip":
-                    ooxml = detect_ooxml_type(filepath)
-                    if ooxml:
-                        return {
-                            "file_type": ooxml[0],
-                            "processor": ooxml[1],
-                            "detection_method": "signature",
-                            "confidence": "high",
-                        }
-                    # Regular zip file
+    candidates = SIGNATURES_BY_FIRST_BYTE.get(header[:1], OFFSET_SIGNATURES)
+    for offset, magic, file_type, processor in candidates:
+        # Anchored compare in C: no slice copy, False when the header is too short
+        if header.startswith(magic, offset):
+            # Special handling for PK signature (could be zip or OOXML)
+            if file_type == "zip":
+                ooxml = detect_ooxml_type(filepath)
+                if ooxml:
                     return {
-                        "file_type": "zip",
-                        "processor": "archive-extractor",
+                        "file_type": ooxml[0],
+                        "processor": ooxml[1],
                         "detection_method": "signature",
                         "confidence": "high",
                     }
+                # Regular zip file
                 return {
-                    "file_type": file_type,
-                    "processor": processor,
+                    "file_type": "zip",
+                    "processor": "archive-extractor",
                     "detection_method": "signature",
                     "confidence": "high",
                 }
+            return {
+                "file_type": file_type,
+                "processor": processor,
+                "detection_method": "signature",
+                "confidence": "high",
+            }
     return None
 
 
 def detect_by_extension(filepath: str) -> Optional[dict]:
     """Fallback detection by file extension."""
-    path = Path(filepath)
-    ext = path.suffix.lower()
+    # Same suffix rule as Path.suffix, without building a Path per file
+    name = os.path.basename(os.path.normpath(filepath))
+    dot = name.rfind(".")
+    ext = name[dot:].lower() if 0 < dot < len(name) - 1 else ""
 
     # Handle compound extensions
-    name_lower = path.name.lower()
-    for compound in [".tar.gz", ".tar.bz2", ".tar.xz"]:
-        if name_lower.endswith(compound):
-            ext = compound
-            break
+    if ext in COMPOUND_LAST_SUFFIXES:
+        name_lower = name.lower()
+        for compound in COMPOUND_EXTENSIONS:
+            if name_lower.endswith(compound):
+                ext = compound
+                break
 
     if ext in EXTENSION_MAP:
         file_type, processor = EXTENSION_MAP[ext]
@@ -225,12 +254,14 @@ def route_file(filepath: str) -> dict:
     """Identify file type and determine processor."""
     path = Path(filepath)
 
-    if not path.exists():
+    # One stat answers exists, is-a-file and size
+    try:
+        stat = path.stat()
+    except (OSError, ValueError):
         return {"error": f"File not found: {filepath}"}
-    if not path.is_file():
+    if not S_ISREG(stat.st_mode):
         return {"error": f"Not a file: {filepath}"}
 
-    stat = path.stat()
     metadata = {
         "path": str(path.absolute()),
         "name": path.name,
@@ -238,6 +269,12 @@ def route_file(filepath: str) -> dict:
         "extension": path.suffix.lower(),
     }
 
+    # Text/code/media extensions decide the route alone: no header read
+    if metadata["extension"] in EXTENSION_AUTHORITATIVE:
+        result = detect_by_extension(filepath)
+        result["metadata"] = metadata
+        return result
+
     # Try signature detection
     try:
         header = read_header(filepath)
@@ -263,6 +300,30 @@ def route_file(filepath: str) -> dict:
     return result
 
 
+def iter_files(root, recursive: bool = False):
+    """
+    Yield a DirEntry for every file in root, then (recursive) in each
+    subdirectory in turn, in the same order as Path.glob. Symlinked files
+    are included; symlinked directories are not entered.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return  # Unreadable directory: skipped, as Path.glob does
+
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.is_file():
+            yield entry
+
+    if recursive:
+        for subdir in subdirs:
+            yield from iter_files(subdir, recursive)
+
+
 def process_directory(dirpath: str, recursive: bool = False) -> list:
     """Process all files in a directory."""
     results = []
@@ -271,16 +332,16 @@ def process_directory(dirpath: str, recursive: bool = False) -> list:
     if not path.exists() or not path.is_dir():
         return [{"error": f"Invalid directory: {dirpath}"}]
 
-    glob_pattern = "**/*" if recursive else "*"
-    for file_path in path.glob(glob_pattern):
-        if file_path.is_file():
-            results.append(route_file(str(file_path)))
+    # scandir's DirEntry knows each entry's type from the directory read
+    for entry in iter_files(dirpath, recursive):
+        results.append(route_file(entry.path))
 
     return results
 
 
+@functools.lru_cache(maxsize=1)
 def list_supported_types() -> dict:
-    """List all supported file types and their processors."""
+    """List all supported file types and their processors (built once; do not modify)."""
     types = {}
 
     # From signatures